@@ -8,7 +8,10 @@ Tests core functionality:
 """
 
 import asyncio
+import contextlib
+import dataclasses
 import json
+import pickle
 import struct
 import tempfile
 import threading
@@ -17,16 +20,19 @@ from pathlib import Path
 
 import pytest
 
-from zelos_extension_modbus.client import (
-    ModbusClient,
+from zelos_extension_modbus.client import ModbusClient
+from zelos_extension_modbus.codec import (
     _reorder_registers,
+    decode_register,
     decode_value,
+    encode_register,
     encode_value,
 )
 from zelos_extension_modbus.demo.simulator import (
     PowerMeterSimulator,
     create_demo_context,
     float32_to_registers,
+    float32_to_registers_swapped,
     uint32_to_registers,
 )
 from zelos_extension_modbus.register_map import Register, RegisterMap
@@ -67,6 +73,12 @@ class TestRegister:
         with pytest.raises(ValueError, match="Invalid byte_order"):
             Register(address=0, name="test", byte_order="invalid")
 
+    @pytest.mark.parametrize("address", [-1, 0x10000, 1 << 24, "5", 5.0, True, None])
+    def test_invalid_address_raises(self, address):
+        """Non-integer addresses and ones outside the 16-bit address space are rejected."""
+        with pytest.raises(ValueError, match="Invalid address"):
+            Register(address=address, name="test")
+
     def test_byte_order_defaults_to_big(self):
         """Default byte order is big endian."""
         reg = Register(address=0, name="test")
@@ -88,6 +100,42 @@ class TestRegister:
         assert Register(address=0, name="t", type="input").writable is False
         assert Register(address=0, name="t", type="discrete_input").writable is False
 
+    def test_registers_share_codecs(self):
+        """Registers with the same definition reuse one decoder and encoder."""
+        a = Register(address=0, name="a", datatype="float32", scale=0.1)
+        b = Register(address=8, name="b", datatype="float32", scale=0.1)
+        assert a._decode is b._decode
+        assert a._encode is b._encode
+
+    def test_register_pickles(self):
+        """Registers and events pickle without their codec closures."""
+        reg = Register(address=3, name="t", datatype="float32", byte_order="big_swap")
+        restored = pickle.loads(pickle.dumps(reg))
+        assert restored == reg
+        assert restored._decode([0xF5C3, 0x4048]) == reg._decode([0xF5C3, 0x4048])
+
+        reg_map = RegisterMap.from_dict({"events": {"a": [{"name": "t", "address": 0}]}})
+        restored_map = pickle.loads(pickle.dumps(reg_map))
+        assert restored_map == reg_map
+        assert restored_map.get_event_block("a") is not None
+
+    def test_register_is_frozen_and_hashable(self):
+        """Registers are immutable value objects usable as dict keys."""
+        reg = Register(address=3, name="t", datatype="float32")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            reg.address = 4
+        assert {reg: 1}[Register(address=3, name="t", datatype="float32")] == 1
+
+    def test_unchecked_matches_validated_construction(self):
+        """The validation-free constructor yields the same register and codecs."""
+        kwargs = {"address": 7, "name": "t", "type": "input", "datatype": "int32", "scale": 0.5}
+        checked = Register(**kwargs)
+        unchecked = Register._unchecked(**kwargs)
+        assert unchecked == checked
+        assert unchecked.writable is False
+        assert unchecked.count == 2
+        assert unchecked._decode([0xFFFF, 0xFFFE]) == checked._decode([0xFFFF, 0xFFFE])
+
 
 class TestRegisterMap:
     """Test RegisterMap parsing."""
@@ -103,6 +151,7 @@ class TestRegisterMap:
         reg_map = RegisterMap.from_dict(data)
         assert set(reg_map.event_names) == {"voltage", "current"}
         assert len(reg_map.registers) == 2
+        assert list(reg_map.iter_registers()) == reg_map.registers
 
     def test_mixed_types_in_event(self):
         """Single event can contain different register types."""
@@ -119,6 +168,66 @@ class TestRegisterMap:
         assert regs[0].type == "holding"
         assert regs[1].type == "coil"
 
+    def test_get_event_sorted_keeps_event_order(self):
+        """Sorted view orders by (type, address) while the event keeps JSON order."""
+        data = {
+            "events": {
+                "status": [
+                    {"name": "b", "address": 5},
+                    {"name": "relay", "address": 9, "type": "coil"},
+                    {"name": "a", "address": 1},
+                ]
+            }
+        }
+        reg_map = RegisterMap.from_dict(data)
+        assert [r.name for r in reg_map.get_event("status")] == ["b", "relay", "a"]
+        assert [r.name for r in reg_map.get_event_sorted("status")] == ["relay", "a", "b"]
+        assert reg_map.get_event_sorted("missing") == ()
+        assert reg_map.get_event("missing") == ()
+
+    def test_event_carries_name_and_addresses(self):
+        """Events know their name and addresses, and stay usable as register lists."""
+        data = {
+            "events": {
+                "status": [
+                    {"name": "temp", "address": 4},
+                    {"name": "alarm", "address": 0, "type": "coil"},
+                ]
+            }
+        }
+        reg_map = RegisterMap.from_dict(data)
+        event = reg_map.events["status"]
+        assert event.name == "status"
+        assert len(event) == 2
+        assert event[0].name == "temp"
+        assert [r.name for r in event] == ["temp", "alarm"]
+        assert event.has_address(4)
+        assert event.has_address(0, "coil")
+        assert not event.has_address(0)
+        pairs = [(e.name, r.name) for e, r in reg_map.iter_event_registers()]
+        assert pairs == [("status", "temp"), ("status", "alarm")]
+
+    def test_plain_register_lists_are_wrapped(self):
+        """RegisterMap wraps plain lists into Events without mutating the argument."""
+        temp = Register(name="temp", address=0)
+        events = {"a": [temp]}
+        reg_map = RegisterMap(events=events)
+        assert reg_map.events["a"].name == "a"
+        assert reg_map.get_event_block("a") is not None
+        assert events == {"a": [temp]}
+        assert reg_map.events is not events
+
+    def test_event_is_immutable(self):
+        """Event registers can't change under the derived sorted view and block plan."""
+        reg_map = RegisterMap.from_dict({"events": {"a": [{"name": "temp", "address": 0}]}})
+        event = reg_map.events["a"]
+        assert isinstance(event.registers, tuple)
+        with pytest.raises(AttributeError):
+            event.registers.append(Register(name="x", address=1))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.registers = ()
+        assert list(event) == [reg_map.get_by_name("temp")]
+
     def test_from_file(self):
         """Register map loads from JSON file."""
         data = {"events": {"test": [{"name": "reg", "address": 0}]}}
@@ -129,6 +238,196 @@ class TestRegisterMap:
         assert len(reg_map.registers) == 1
         Path(f.name).unlink()
 
+    def test_from_file_without_orjson(self, monkeypatch, tmp_path):
+        """Register map falls back to stdlib json when orjson is unavailable."""
+        from zelos_extension_modbus import register_map as register_map_module
+
+        monkeypatch.setattr(register_map_module, "orjson", None)
+        path = tmp_path / "map.json"
+        path.write_text(json.dumps({"events": {"test": [{"name": "reg", "address": 3}]}}))
+        reg_map = RegisterMap.from_file(path)
+        assert reg_map.get_by_name("reg").address == 3
+
+    def test_from_file_reuses_unchanged_map(self, tmp_path):
+        """Loading an unchanged file reuses the parsed registers; edits trigger a reparse."""
+        path = tmp_path / "map.json"
+        path.write_text(json.dumps({"events": {"a": [{"name": "reg", "address": 0}]}}))
+        first = RegisterMap.from_file(path)
+        second = RegisterMap.from_file(str(path))
+        assert second is not first
+        assert second.get_by_name("reg") is first.get_by_name("reg")
+
+        path.write_text(json.dumps({"events": {"a": [{"name": "reg", "address": 10}]}}))
+        reloaded = RegisterMap.from_file(path)
+        assert reloaded is not first
+        assert reloaded.get_by_name("reg").address == 10
+
+    def test_from_file_copies_are_independent(self, tmp_path):
+        """Mutating a loaded map doesn't leak into later loads of the same file."""
+        path = tmp_path / "map.json"
+        path.write_text(json.dumps({"events": {"a": [{"name": "reg", "address": 0}]}}))
+        first = RegisterMap.from_file(path)
+        first.add_register("a", Register(address=5, name="injected"))
+        first.registers.append(Register(address=6, name="appended"))
+
+        reloaded = RegisterMap.from_file(path)
+        assert reloaded.get_by_name("injected") is None
+        assert [r.name for r in reloaded.registers] == ["reg"]
+        assert [r.name for r in reloaded.get_event("a")] == ["reg"]
+
+    def test_from_file_streaming_matches_in_memory(self, monkeypatch, tmp_path):
+        """Large files stream-parsed with ijson load the same map as from_dict."""
+        pytest.importorskip("ijson")
+        from zelos_extension_modbus import register_map as register_map_module
+
+        # Top-level scalars after the events, a dotted event name, an empty event
+        # and register-level descriptions must all survive the single pass
+        data = {
+            "events": {
+                "voltage": [{"name": "L1", "address": 0, "datatype": "float32", "scale": 0.1}],
+                "status.flags": [
+                    {"name": "door", "address": 2, "type": "discrete_input", "description": "d"}
+                ],
+                "empty": [],
+            },
+            "name": "meter",
+            "description": "streamed",
+        }
+        path = tmp_path / "map.json"
+        path.write_text(json.dumps(data))
+        monkeypatch.setattr(register_map_module, "STREAM_THRESHOLD_BYTES", 0)
+
+        reg_map = RegisterMap.from_file(path)
+        assert reg_map == RegisterMap.from_dict(data)
+        assert (reg_map.name, reg_map.description) == ("meter", "streamed")
+        assert reg_map.event_names == ["voltage", "status.flags", "empty"]
+        assert isinstance(reg_map.get_by_name("L1").scale, float)
+
+    def test_from_dict_reports_invalid_entry(self):
+        """A bad entry in a batch still raises the per-register validation error."""
+        data = {
+            "events": {
+                "a": [
+                    {"name": "ok", "address": 0},
+                    {"name": "bad", "address": 1, "datatype": "float16"},
+                ]
+            }
+        }
+        with pytest.raises(ValueError, match="Invalid datatype 'float16'"):
+            RegisterMap.from_dict(data)
+
+    @pytest.mark.parametrize(
+        "entry,message",
+        [
+            ({"type": None}, "Invalid register type"),
+            ({"datatype": 32}, "Invalid datatype"),
+            ({"byte_order": ["big"]}, "Invalid byte_order"),
+        ],
+    )
+    def test_from_dict_rejects_non_string_enums(self, entry, message):
+        """Non-string enum values raise the validation error, not a TypeError."""
+        data = {"events": {"a": [{"name": "bad", "address": 0, **entry}]}}
+        with pytest.raises(ValueError, match=message):
+            RegisterMap.from_dict(data)
+
+    def test_from_dict_rejects_out_of_range_address(self):
+        """An out-of-range address in a batch raises instead of aliasing another type."""
+        data = {
+            "events": {
+                "a": [
+                    {"name": "h0", "address": 0},
+                    {"name": "far", "address": 1 << 24, "type": "input"},
+                ]
+            }
+        }
+        with pytest.raises(ValueError, match="Invalid address"):
+            RegisterMap.from_dict(data)
+
+        data["events"]["a"][1] = {"name": "float", "address": 5.0}
+        with pytest.raises(ValueError, match="Invalid address"):
+            RegisterMap.from_dict(data)
+
+    def test_plan_reads_coalesces_blocks(self):
+        """Nearby registers merge into block reads bounded by gap and size."""
+        data = {
+            "events": {
+                "a": [
+                    {"name": "v1", "address": 0, "datatype": "float32"},
+                    {"name": "v2", "address": 2, "datatype": "float32"},
+                    {"name": "t", "address": 6},
+                    {"name": "e", "address": 100, "datatype": "uint64"},
+                    {"name": "relay", "address": 3, "type": "coil"},
+                ]
+            }
+        }
+        reg_map = RegisterMap.from_dict(data)
+        assert reg_map.plan_reads("holding") == [(0, 4), (6, 1), (100, 4)]
+        assert reg_map.plan_reads("holding", max_gap=2) == [(0, 7), (100, 4)]
+        assert reg_map.plan_reads("holding", max_gap=2, max_count=4) == [
+            (0, 4),
+            (6, 1),
+            (100, 4),
+        ]
+        assert reg_map.plan_reads("coil") == [(3, 1)]
+        assert reg_map.plan_reads("input") == []
+        subset = [reg_map.get_by_address(a) for a in (0, 2, 6)]
+        assert reg_map.plan_reads("holding", registers=subset) == [(0, 4), (6, 1)]
+        assert reg_map.plan_reads("coil", registers=subset) == []
+
+    def test_plan_reads_oversize_register_once(self):
+        """A register wider than max_count is read once, not duplicated."""
+        data = {"events": {"a": [{"name": "big", "address": 10, "datatype": "uint64"}]}}
+        reg_map = RegisterMap.from_dict(data)
+        assert reg_map.plan_reads("holding", max_count=2) == [(10, 4)]
+
+        data["events"]["a"].append({"name": "next", "address": 14})
+        reg_map = RegisterMap.from_dict(data)
+        assert reg_map.plan_reads("holding", max_count=2) == [(10, 4), (14, 1)]
+
+    def test_event_block_matches_register_decode(self):
+        """Block decode of an event equals decoding each register on its own."""
+        data = {
+            "events": {
+                "meter": [
+                    {"name": "v", "address": 11, "datatype": "float32", "scale": 0.1},
+                    {"name": "t", "address": 10, "datatype": "int16"},
+                    {"name": "e", "address": 13, "datatype": "uint64", "byte_order": "big_swap"},
+                    {"name": "f", "address": 17, "datatype": "float32", "byte_order": "little"},
+                    {"name": "ok", "address": 19, "datatype": "bool"},
+                ],
+                "gapped": [
+                    {"name": "g1", "address": 30},
+                    {"name": "g2", "address": 32},
+                ],
+                "mixed": [
+                    {"name": "a", "address": 0},
+                    {"name": "b", "address": 0, "type": "coil"},
+                ],
+            }
+        }
+        reg_map = RegisterMap.from_dict(data)
+        assert reg_map.get_event_block("mixed") is None
+        assert reg_map.get_event_block("gapped") is None
+        assert reg_map.get_event_block("missing") is None
+
+        block = reg_map.get_event_block("meter")
+        assert (block.register_type, block.start, block.count) == ("holding", 10, 10)
+        assert block.field_names == ("t", "v", "e", "f", "ok")
+
+        sample = {"t": -12, "v": 230.5, "e": 2**40 + 7, "f": -1.5, "ok": True}
+        words = [0] * block.count
+        for name, value in sample.items():
+            reg = reg_map.get_by_name(name)
+            offset = reg.address - block.start
+            words[offset : offset + reg.count] = encode_register(reg, value)
+
+        decoded = block.decode(words)
+        for name in sample:
+            reg = reg_map.get_by_name(name)
+            offset = reg.address - block.start
+            expected = decode_register(reg, words[offset : offset + reg.count])
+            assert decoded[name] == expected
+
     def test_get_by_name(self):
         """Find register by name across events."""
         data = {
@@ -142,6 +441,70 @@ class TestRegisterMap:
         assert reg_map.get_by_name("current").address == 1
         assert reg_map.get_by_name("nonexistent") is None
 
+    def test_get_by_address(self):
+        """Find register by address and type; first definition wins on duplicates."""
+        data = {
+            "events": {
+                "a": [
+                    {"name": "temp", "address": 0, "type": "holding"},
+                    {"name": "relay", "address": 0, "type": "coil"},
+                ],
+                "b": [{"name": "temp_alias", "address": 0, "type": "holding"}],
+            }
+        }
+        reg_map = RegisterMap.from_dict(data)
+        assert reg_map.get_by_address(0).name == "temp"
+        assert reg_map.get_by_address(0, "coil").name == "relay"
+        assert reg_map.get_by_address(0, "input") is None
+        assert reg_map.get_by_address(7) is None
+        assert reg_map.get_by_address(1 << 16, "discrete_input") is None
+        assert reg_map.get_by_address(-1) is None
+        assert not reg_map.events["a"].has_address(1 << 16, "discrete_input")
+
+    def test_add_register_updates_indexes(self):
+        """Registers added after load are visible to every lookup."""
+        reg_map = RegisterMap.from_dict({"events": {"a": [{"name": "temp", "address": 0}]}})
+        reg_map.add_register("b", Register(address=4, name="relay", type="coil"))
+        assert reg_map.event_names == ["a", "b"]
+        assert reg_map.get_by_name("relay").address == 4
+        assert reg_map.get_by_address(4, "coil").name == "relay"
+        assert [r.name for r in reg_map.get_by_type("coil")] == ["relay"]
+        assert [r.name for r in reg_map.get_range("coil", 0, 10)] == ["relay"]
+
+    def test_get_by_type(self):
+        """Registers are grouped by Modbus type across events."""
+        data = {
+            "events": {
+                "a": [
+                    {"name": "temp", "address": 0, "type": "holding"},
+                    {"name": "relay", "address": 0, "type": "coil"},
+                ],
+                "b": [{"name": "limit", "address": 5, "type": "holding"}],
+            }
+        }
+        reg_map = RegisterMap.from_dict(data)
+        assert [r.name for r in reg_map.get_by_type("holding")] == ["temp", "limit"]
+        assert [r.name for r in reg_map.get_by_type("coil")] == ["relay"]
+        assert reg_map.get_by_type("input") == ()
+
+    def test_get_range(self):
+        """Range query returns registers of one type sorted by address, end exclusive."""
+        data = {
+            "events": {
+                "a": [
+                    {"name": "c", "address": 20},
+                    {"name": "a", "address": 0},
+                    {"name": "relay", "address": 5, "type": "coil"},
+                ],
+                "b": [{"name": "b", "address": 10}],
+            }
+        }
+        reg_map = RegisterMap.from_dict(data)
+        assert [r.name for r in reg_map.get_range("holding", 0, 20)] == ["a", "b"]
+        assert [r.name for r in reg_map.get_range("holding", 5, 100)] == ["b", "c"]
+        assert reg_map.get_range("holding", 21, 100) == []
+        assert reg_map.get_range("input", 0, 100) == []
+
     def test_writable_registers(self):
         """writable_registers excludes input and discrete_input types."""
         data = {
@@ -234,6 +597,45 @@ class TestValueCodec:
         """Scale factor is applied before encoding."""
         assert encode_value(100, "uint16", scale=0.1) == [1000]
 
+    @pytest.mark.parametrize(
+        "datatype,value",
+        [
+            ("uint16", -1),
+            ("uint16", 65536),
+            ("int16", 40000),
+            ("int16", 70000),
+            ("int16", -32769),
+            ("uint32", -1),
+            ("uint32", 2**32),
+            ("int32", 2**31),
+            ("uint64", -1),
+            ("int64", 2**63),
+        ],
+    )
+    def test_encode_out_of_range_raises(self, datatype, value):
+        """Out-of-range integers are rejected instead of wrapped."""
+        with pytest.raises(ValueError, match="out of range"):
+            encode_value(value, datatype)
+
+    def test_encode_range_applies_after_scale(self):
+        """Range is checked on the scaled raw value."""
+        assert encode_value(6553.5, "uint16", scale=0.1) == [65535]
+        with pytest.raises(ValueError):
+            encode_value(6553.6, "uint16", scale=0.1)
+
+    @pytest.mark.parametrize(
+        "datatype,value,expected",
+        [
+            ("int16", -32768, [0x8000]),
+            ("int16", 32767, [0x7FFF]),
+            ("uint32", 2**32 - 1, [0xFFFF, 0xFFFF]),
+            ("int32", -(2**31), [0x8000, 0x0000]),
+        ],
+    )
+    def test_encode_range_bounds(self, datatype, value, expected):
+        """Values at the datatype bounds are still accepted."""
+        assert encode_value(value, datatype) == expected
+
     def test_roundtrip(self):
         """Encode then decode returns original value."""
         for value, datatype in [(1234, "uint16"), (-100, "int16"), (100000, "uint32")]:
@@ -241,6 +643,45 @@ class TestValueCodec:
             decoded = decode_value(encoded, datatype)
             assert decoded == value
 
+    def test_register_codec_matches_value_codec(self):
+        """decode_register/encode_register agree with the string-based helpers."""
+        for reg in [
+            Register(address=0, name="t", datatype="int16", scale=0.1),
+            Register(address=0, name="t", datatype="float32", byte_order="big_swap"),
+            Register(address=0, name="t", datatype="uint32", scale=2.0, byte_order="little"),
+        ]:
+            raw = encode_register(reg, 42)
+            assert raw == encode_value(42, reg.datatype, reg.scale, reg.byte_order)
+            expected = decode_value(raw, reg.datatype, reg.scale, reg.byte_order)
+            assert decode_register(reg, raw) == expected
+
+    @pytest.mark.parametrize("byte_order", ["big", "little", "big_swap", "little_swap"])
+    @pytest.mark.parametrize(
+        "datatype,value",
+        [
+            ("uint16", 65535),
+            ("int16", -12345),
+            ("uint32", 0xDEADBEEF),
+            ("int32", -123456789),
+            ("float32", 1.5),
+            ("uint64", 0x0123456789ABCDEF),
+            ("int64", -(2**40) - 7),
+            ("float64", -2.25),
+        ],
+    )
+    def test_roundtrip_all_datatypes(self, datatype, value, byte_order):
+        """Every datatype round-trips through the specialized codecs."""
+        reg = Register(address=0, name="t", datatype=datatype, byte_order=byte_order)
+        raw = encode_register(reg, value)
+        assert len(raw) == reg.count
+        assert decode_register(reg, raw) == value
+
+    def test_decode_register_unity_scale_keeps_64bit_precision(self):
+        """Unity scale skips the float multiply, so large 64-bit values stay exact."""
+        reg = Register(address=0, name="t", datatype="uint64")
+        value = 2**63 + 1
+        assert decode_register(reg, encode_register(reg, value)) == value
+
 
 class TestByteOrder:
     """Test byte order handling for multi-register values."""
@@ -320,6 +761,12 @@ class TestSimulatorHelpers:
         assert r1 == 0x0001
         assert r2 == 0x0000
 
+    def test_float32_to_registers_swapped(self):
+        """Swapped float32 puts the low word first and decodes as big_swap."""
+        r1, r2 = float32_to_registers(-3.5)
+        assert float32_to_registers_swapped(-3.5) == (r2, r1)
+        assert decode_value([r2, r1], "float32", byte_order="big_swap") == -3.5
+
 
 class TestPowerMeterSimulator:
     """Test simulator physics logic."""
@@ -379,6 +826,90 @@ class TestPowerMeterSimulator:
         assert 0.7 < values["power_factor"] < 1.0
 
 
+class TestSimulatorUpdater:
+    """Test simulator values landing in the datastore."""
+
+    def test_update_datastore_writes_holding_block(self):
+        """All holding register values are written at their mapped addresses."""
+        from zelos_extension_modbus.demo.simulator import SimulatorUpdater
+
+        context = create_demo_context()
+        sim = PowerMeterSimulator()
+        updater = SimulatorUpdater(sim, context)
+        values = sim.update(dt=0.1)
+        updater._update_datastore(values)
+
+        hr = context[0].store["h"]
+        regs = hr.getValues(1, 21)
+        assert tuple(regs[0:2]) == float32_to_registers(values["voltage_l1"])
+        assert tuple(regs[16:18]) == float32_to_registers(values["frequency"])
+        assert tuple(regs[18:20]) == uint32_to_registers(values["energy_total"])
+        assert regs[20] == values["temperature"] & 0xFFFF
+        # Setpoints beyond the block are untouched
+        assert hr.getValues(101, 2) == [250, 210]
+
+        coils = context[0].store["c"]
+        assert coils.getValues(1, 3) == [values["relay1"], values["relay2"], values["alarm"]]
+
+    def test_update_datastore_skips_unchanged_values(self):
+        """Repeating the same values does not rewrite the holding block or coils."""
+        from zelos_extension_modbus.demo.simulator import SimulatorUpdater
+
+        context = create_demo_context()
+        sim = PowerMeterSimulator()
+        updater = SimulatorUpdater(sim, context)
+        values = sim.update(dt=0.1)
+        updater._update_datastore(values)
+
+        # Clobber the store directly; an unchanged tick must leave it alone
+        context[0].store["h"].setValues(1, [0, 0])
+        context[0].store["c"].setValues(1, [True])
+        updater._update_datastore(dict(values))
+        assert context[0].store["h"].getValues(1, 2) == [0, 0]
+        assert context[0].store["c"].getValues(1, 1) == [True]
+
+        updater._update_datastore({**values, "voltage_l1": values["voltage_l1"] + 1.0})
+        assert tuple(context[0].store["h"].getValues(1, 2)) == float32_to_registers(
+            values["voltage_l1"] + 1.0
+        )
+
+    def test_door_flips_when_countdown_expires(self):
+        """Door input toggles when its tick countdown reaches zero, then reschedules."""
+        from zelos_extension_modbus.demo.simulator import SimulatorUpdater
+
+        context = create_demo_context()
+        sim = PowerMeterSimulator()
+        updater = SimulatorUpdater(sim, context)
+        di = context[0].store["d"]
+        assert di.getValues(1, 1) == [False]
+
+        updater._ticks_to_door_flip = 1
+        updater._update_datastore(sim.update(dt=0.1))
+        assert di.getValues(1, 1) == [True]
+        assert updater._ticks_to_door_flip >= 1
+
+    def test_updater_runs_as_task(self):
+        """Updater writes from a task on the running loop and stops cleanly."""
+        from zelos_extension_modbus.demo.simulator import SimulatorUpdater
+
+        context = create_demo_context()
+        updater = SimulatorUpdater(PowerMeterSimulator(), context, interval=0.01)
+
+        async def run():
+            updater.start()
+            await asyncio.sleep(0.05)
+            await updater.stop()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run())
+        finally:
+            loop.close()
+        assert updater._task is None
+        # Voltage L1 has been written (nominal 230V is never zero)
+        assert context[0].store["h"].getValues(1, 2) != [0, 0]
+
+
 # =============================================================================
 # Integration Tests with Demo Server
 # =============================================================================
@@ -413,17 +944,16 @@ class DemoServer:
         context = create_demo_context()
         simulator = PowerMeterSimulator()
         updater = SimulatorUpdater(simulator, context, interval=0.05)
-        updater.start()
 
         async def run_server():
-            await StartAsyncTcpServer(context=context, address=(self.host, self.port))
+            updater.start()
+            try:
+                await StartAsyncTcpServer(context=context, address=(self.host, self.port))
+            finally:
+                await updater.stop()
 
-        try:
+        with contextlib.suppress(Exception):
             self._loop.run_until_complete(run_server())
-        except Exception:
-            pass
-        finally:
-            updater.stop()
 
     def stop(self):
         """Stop the server."""
@@ -623,6 +1153,20 @@ class TestDemoServerIntegration:
         value = asyncio.get_event_loop().run_until_complete(write_and_read())
         assert value == -10000
 
+    def test_write_out_of_range_fails(self, client):
+        """Out-of-range writes fail without touching the device."""
+        reg = client.register_map.get_by_name("power_limit")
+        assert reg is not None
+
+        async def write_and_read():
+            before = await client.read_register_value(reg)
+            success = await client.write_register_value(reg, 2**31)
+            return before, success, await client.read_register_value(reg)
+
+        before, success, after = asyncio.get_event_loop().run_until_complete(write_and_read())
+        assert success is False
+        assert after == before
+
     def test_write_coil(self, client):
         """Write coil register."""
         reg = client.register_map.get_by_name("relay1")
@@ -714,6 +1258,132 @@ class TestDemoServerIntegration:
         # Check values are reasonable
         assert 200 < results["voltage"]["L1"] < 260
 
+    def test_poll_reuses_result_dicts(self, client):
+        """Repeated polls update the same result dictionaries in place."""
+
+        async def poll():
+            return await client._poll_registers()
+
+        first = asyncio.get_event_loop().run_until_complete(poll())
+        voltage = first["voltage"]
+        second = asyncio.get_event_loop().run_until_complete(poll())
+        assert second is first
+        assert second["voltage"] is voltage
+
+    def test_poll_skips_unchanged_registers(self, client):
+        """Registers whose raw value did not change are left out of later polls."""
+
+        async def poll():
+            return await client._poll_registers()
+
+        first = asyncio.get_event_loop().run_until_complete(poll())
+        assert first["inputs"]["firmware_version"] == 0x0102
+        assert first["digital_inputs"]["grid_connected"] is True
+
+        second = asyncio.get_event_loop().run_until_complete(poll())
+        assert "firmware_version" not in second["inputs"]
+        assert "grid_connected" not in second["digital_inputs"]
+
+    def test_poll_rtu_keeps_one_request_in_flight(self, client):
+        """The RTU branch issues reads one after another and decodes them the same way."""
+        in_flight = 0
+        peak = 0
+
+        def track(read):
+            async def wrapper(address, count=1):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    return await read(address, count)
+                finally:
+                    in_flight -= 1
+
+            return wrapper
+
+        client._readers = {t: track(read) for t, read in client._readers.items()}
+        client.transport = "rtu"
+
+        async def poll():
+            return await client._poll_registers()
+
+        results = asyncio.get_event_loop().run_until_complete(poll())
+        assert peak == 1
+        assert 200 < results["voltage"]["L1"] < 260
+        assert results["inputs"]["firmware_version"] == 0x0102
+        assert results["digital_inputs"]["grid_connected"] is True
+
+    @pytest.mark.parametrize("transport", ["tcp", "rtu"])
+    @pytest.mark.parametrize(
+        "error,connected", [(RuntimeError("boom"), True), (OSError("Connection reset"), False)]
+    )
+    def test_poll_survives_read_exception(self, client, transport, error, connected):
+        """A read that raises is skipped like a failed read; the rest of the poll completes."""
+
+        async def broken(address, count=1):
+            raise error
+
+        client._readers = {**client._readers, "coil": broken}
+        client.transport = transport
+        errors_before = client._error_count
+
+        async def poll():
+            return await client._poll_registers()
+
+        results = asyncio.get_event_loop().run_until_complete(poll())
+        assert 200 < results["voltage"]["L1"] < 260
+        assert "temperature" in results["status"]
+        assert "relay1" not in results["status"]
+        assert client._error_count == errors_before + 1
+        assert client._connected is connected
+
+    def test_poll_coalesces_remaining_registers(self, client):
+        """Registers outside block events are coalesced into one read per run."""
+
+        async def poll():
+            return await client._poll_registers()
+
+        results = asyncio.get_event_loop().run_until_complete(poll())
+
+        loose = {
+            (r.register_type, r.start, r.count): [reg.name for _, reg, _ in r.fields]
+            for r in client._poll_plan
+            if r.block is None
+        }
+        assert loose == {
+            ("holding", 20, 1): ["temperature"],
+            ("coil", 0, 3): ["relay1", "relay2", "alarm"],
+            ("discrete_input", 0, 3): ["door_open", "external_fault", "grid_connected"],
+        }
+        assert set(results["status"]) == {"temperature", "relay1", "relay2", "alarm"}
+        assert results["digital_inputs"]["grid_connected"] is True
+
+    def test_poll_reads_contiguous_events_as_blocks(self, client):
+        """Contiguous events are read in one request and match per-register reads."""
+
+        async def poll_and_read():
+            results = await client._poll_registers()
+            regs = client.register_map.get_event("setpoints")
+            return results, [await client.read_register_value(r) for r in regs]
+
+        results, expected = asyncio.get_event_loop().run_until_complete(poll_and_read())
+
+        # Map each block read back to its event through the result dict it fills
+        blocks = {
+            name: r
+            for r in client._poll_plan
+            if r.block is not None
+            for name, values in results.items()
+            if r.block[0] is values
+        }
+        voltage = blocks["voltage"]
+        assert (voltage.register_type, voltage.start, voltage.count) == ("holding", 0, 6)
+        assert "setpoints" in blocks
+        assert "status" not in blocks  # mixes holding registers and coils
+        setpoints = [r.name for r in client.register_map.get_event("setpoints")]
+        assert [results["setpoints"][name] for name in setpoints] == expected
+        assert 200 < results["voltage"]["L1"] < 260
+
 
 # =============================================================================
 # Action Tests
@@ -743,6 +1413,42 @@ class TestReconnection:
         assert client._is_connection_error(ValueError("bad value")) is False
 
 
+class TestTraceSchema:
+    """Tests for trace source reuse."""
+
+    def test_trace_source_reused_across_restarts(self):
+        """Restarting a client with an unchanged schema keeps its trace source."""
+        data = {"name": "schema_test", "events": {"a": [{"name": "x", "address": 0}]}}
+        client = ModbusClient(register_map=RegisterMap.from_dict(data))
+        client._init_trace_source()
+        source = client._source
+        client._init_trace_source()
+        assert client._source is source
+
+    def test_trace_source_not_shared_between_clients(self):
+        """Clients with identical maps get their own trace sources."""
+        data = {"name": "schema_test", "events": {"a": [{"name": "x", "address": 0}]}}
+        first = ModbusClient(register_map=RegisterMap.from_dict(data))
+        second = ModbusClient(register_map=RegisterMap.from_dict(data))
+        first._init_trace_source()
+        second._init_trace_source()
+        assert first._source is not second._source
+
+    def test_trace_source_rebuilt_when_schema_changes(self):
+        """A changed field datatype produces a new trace source."""
+        data = {"name": "schema_test", "events": {"a": [{"name": "x", "address": 0}]}}
+        changed = {
+            "name": "schema_test",
+            "events": {"a": [{"name": "x", "address": 0, "datatype": "float32"}]},
+        }
+        client = ModbusClient(register_map=RegisterMap.from_dict(data))
+        client._init_trace_source()
+        source = client._source
+        client.register_map = RegisterMap.from_dict(changed)
+        client._init_trace_source()
+        assert client._source is not source
+
+
 class TestActionsUnit:
     """Unit tests for SDK actions (no network)."""
 
@@ -880,3 +1586,20 @@ class TestActionsIntegration:
         result = client.write_named_register("firmware_version", 999)
         assert result["success"] is False
         assert "not writable" in result["error"]
+
+    def test_actions_share_event_loop(self, demo_server, register_map):
+        """Network actions run on one long-lived loop and reuse its connection."""
+        client = ModbusClient(
+            host=demo_server.host, port=demo_server.port, register_map=register_map
+        )
+        try:
+            by_address = client.read_register_action(0, "input", 1)
+            loop = client._loop
+            by_name = client.read_named_register("firmware_version")
+            assert client._loop is loop
+        finally:
+            client.stop()
+
+        assert by_address["values"] == [0x0102]
+        assert by_name["value"] == 0x0102
+        assert loop.is_closed()
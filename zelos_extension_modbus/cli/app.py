@@ -57,21 +57,25 @@ def start_demo_server() -> threading.Thread:
         context = create_demo_context()
         simulator = PowerMeterSimulator()
         updater = SimulatorUpdater(simulator, context, interval=0.1)
-        updater.start()
 
         from pymodbus.server import StartAsyncTcpServer
 
-        try:
-            loop.run_until_complete(
-                StartAsyncTcpServer(
+        async def serve() -> None:
+            """Run the simulator updater alongside the server on this loop."""
+            updater.start()
+            try:
+                await StartAsyncTcpServer(
                     context=context,
                     address=(DEMO_HOST, DEMO_PORT),
                 )
-            )
+            finally:
+                await updater.stop()
+
+        try:
+            loop.run_until_complete(serve())
         except Exception as e:
             logger.error(f"Demo server error: {e}")
         finally:
-            updater.stop()
             loop.close()
 
     thread = threading.Thread(target=run_server, daemon=True)
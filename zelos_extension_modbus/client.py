@@ -3,157 +3,86 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
+import hashlib
 import logging
-import struct
-from typing import Any
+import threading
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import zelos_sdk
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
-from zelos_extension_modbus.register_map import Register, RegisterMap
-
-logger = logging.getLogger(__name__)
+from zelos_extension_modbus.codec import decode_value, encode_value  # noqa: F401 - re-exported
+from zelos_extension_modbus.register_map import EventBlock, Register, RegisterMap
 
+if TYPE_CHECKING:
+    from pymodbus.pdu import ModbusPDU
 
-def _reorder_registers(registers: list[int], byte_order: str, for_decode: bool = True) -> list[int]:
-    """Reorder registers based on byte order.
+try:
+    import uvloop
+except ImportError:  # optional, not available on Windows
+    uvloop = None
 
-    Args:
-        registers: List of 16-bit register values
-        byte_order: One of 'big', 'little', 'big_swap', 'little_swap'
-        for_decode: True if preparing for decode, False for encode
+logger = logging.getLogger(__name__)
 
-    Returns:
-        Reordered register list
-    """
-    if len(registers) <= 1:
-        return registers
-
-    regs = list(registers)
-
-    if byte_order == "big":
-        # Standard Modbus: AB CD (no change)
-        pass
-    elif byte_order == "little":
-        # Full little endian: DC BA (reverse all)
-        regs = regs[::-1]
-    elif byte_order == "big_swap":
-        # Big endian with word swap: CD AB (swap pairs)
-        if len(regs) == 2:
-            regs = [regs[1], regs[0]]
-        elif len(regs) == 4:
-            regs = [regs[1], regs[0], regs[3], regs[2]]
-    elif byte_order == "little_swap":
-        # Little endian with word swap: BA DC
-        if len(regs) == 2:
-            regs = [regs[1], regs[0]]
-        elif len(regs) == 4:
-            regs = [regs[3], regs[2], regs[1], regs[0]]
-
-    return regs
-
-
-def decode_value(
-    registers: list[int], datatype: str, scale: float = 1.0, byte_order: str = "big"
-) -> float | int | bool:
-    """Decode raw register values to typed value.
-
-    Args:
-        registers: List of 16-bit register values
-        datatype: Data type string
-        scale: Scale factor to apply
-        byte_order: Byte order ('big', 'little', 'big_swap', 'little_swap')
-
-    Returns:
-        Decoded and scaled value
-    """
-    # Reorder registers based on byte order before decoding
-    regs = _reorder_registers(registers, byte_order, for_decode=True)
-
-    if datatype == "bool":
-        return bool(regs[0])
-    elif datatype == "uint16":
-        return int(regs[0] * scale)
-    elif datatype == "int16":
-        raw = struct.pack(">H", regs[0])
-        value = struct.unpack(">h", raw)[0]
-        return int(value * scale)
-    elif datatype == "uint32":
-        raw = struct.pack(">HH", regs[0], regs[1])
-        value = struct.unpack(">I", raw)[0]
-        return int(value * scale)
-    elif datatype == "int32":
-        raw = struct.pack(">HH", regs[0], regs[1])
-        value = struct.unpack(">i", raw)[0]
-        return int(value * scale)
-    elif datatype == "float32":
-        raw = struct.pack(">HH", regs[0], regs[1])
-        value = struct.unpack(">f", raw)[0]
-        return float(value * scale)
-    elif datatype == "uint64":
-        raw = struct.pack(">HHHH", *regs[:4])
-        value = struct.unpack(">Q", raw)[0]
-        return int(value * scale)
-    elif datatype == "int64":
-        raw = struct.pack(">HHHH", *regs[:4])
-        value = struct.unpack(">q", raw)[0]
-        return int(value * scale)
-    elif datatype == "float64":
-        raw = struct.pack(">HHHH", *regs[:4])
-        value = struct.unpack(">d", raw)[0]
-        return float(value * scale)
+T = TypeVar("T")
+
+# Register datatype -> Zelos SDK DataType used for trace schema fields
+_SDK_DATATYPES: dict[str, zelos_sdk.DataType] = {
+    "bool": zelos_sdk.DataType.Boolean,
+    "uint16": zelos_sdk.DataType.UInt16,
+    "int16": zelos_sdk.DataType.Int16,
+    "uint32": zelos_sdk.DataType.UInt32,
+    "int32": zelos_sdk.DataType.Int32,
+    "float32": zelos_sdk.DataType.Float32,
+    "uint64": zelos_sdk.DataType.UInt64,
+    "int64": zelos_sdk.DataType.Int64,
+    "float64": zelos_sdk.DataType.Float64,
+}
+
+
+def _schema_key(register_map: RegisterMap | None) -> bytes:
+    """Digest of everything that shapes the trace schema of a register map."""
+    if register_map is None:
+        schema: Any = ("modbus", None)
     else:
-        return regs[0]
-
-
-def encode_value(
-    value: float | int | bool, datatype: str, scale: float = 1.0, byte_order: str = "big"
-) -> list[int]:
-    """Encode typed value to raw register values.
-
-    Args:
-        value: Value to encode
-        datatype: Data type string
-        scale: Scale factor (value will be divided by scale)
-        byte_order: Byte order ('big', 'little', 'big_swap', 'little_swap')
-
-    Returns:
-        List of 16-bit register values
+        schema = (
+            register_map.name,
+            [
+                (event_name, [(r.name, r.datatype, r.unit) for r in regs])
+                for event_name, regs in register_map.events.items()
+            ],
+        )
+    return hashlib.blake2b(repr(schema).encode(), digest_size=16).digest()
+
+
+@dataclass(slots=True)
+class _PollRead:
+    """One read request of the poll plan and the event fields it fills in.
+
+    Either `block` decodes the whole response with one unpack, or each entry of
+    `fields` is decoded from its own slice of the response.
     """
-    scaled = value / scale if scale != 0 else value
-
-    if datatype == "bool":
-        regs = [1 if value else 0]
-    elif datatype == "uint16":
-        regs = [int(scaled) & 0xFFFF]
-    elif datatype == "int16":
-        raw = struct.pack(">h", int(scaled))
-        regs = [struct.unpack(">H", raw)[0]]
-    elif datatype == "uint32":
-        raw = struct.pack(">I", int(scaled))
-        regs = list(struct.unpack(">HH", raw))
-    elif datatype == "int32":
-        raw = struct.pack(">i", int(scaled))
-        regs = list(struct.unpack(">HH", raw))
-    elif datatype == "float32":
-        raw = struct.pack(">f", float(scaled))
-        regs = list(struct.unpack(">HH", raw))
-    elif datatype == "uint64":
-        raw = struct.pack(">Q", int(scaled))
-        regs = list(struct.unpack(">HHHH", raw))
-    elif datatype == "int64":
-        raw = struct.pack(">q", int(scaled))
-        regs = list(struct.unpack(">HHHH", raw))
-    elif datatype == "float64":
-        raw = struct.pack(">d", float(scaled))
-        regs = list(struct.unpack(">HHHH", raw))
-    else:
-        regs = [int(value) & 0xFFFF]
 
-    # Reorder registers based on byte order for writing
-    return _reorder_registers(regs, byte_order, for_decode=False)
+    register_type: str
+    start: int
+    count: int
+    # (event values, block decode plan) for events read as a single block
+    block: tuple[dict[str, Any], EventBlock] | None = None
+    # (event values, register, word offset) per register in the response
+    fields: tuple[tuple[dict[str, Any], Register, int], ...] = ()
+    # Response and per-field values from the previous poll, to skip unchanged fields
+    last_raw: list[int] | list[bool] | None = None
+    last: list[Any] = field(default_factory=list)
+
+    def reset(self) -> None:
+        """Forget the previous poll so every field is reported again."""
+        self.last_raw = None
+        self.last = [None] * (len(self.block[1].field_names) if self.block else len(self.fields))
 
 
 class ModbusClient:
@@ -200,9 +129,29 @@ class ModbusClient:
         self._poll_count = 0
         self._error_count = 0
 
-        # Zelos SDK trace source
+        # Read method for each register type
+        self._readers = {
+            "holding": self.read_holding_registers,
+            "input": self.read_input_registers,
+            "coil": self.read_coils,
+            "discrete_input": self.read_discrete_inputs,
+        }
+
+        # Poll plan and result dicts, allocated once and reused every cycle
+        self._poll_plan: tuple[_PollRead, ...] | None = None
+        self._poll_results: dict[str, dict[str, Any]] = {}
+
+        # Zelos SDK trace source, and the schema digest it was built for. Reuse is
+        # per client: the source caches last values, which must not mix devices.
         self._source: zelos_sdk.TraceSourceCacheLast | None = None
-        self._schema_emitted = False
+        self._source_schema: bytes | None = None
+
+        # Long-lived event loop shared by the polling loop and SDK actions, so
+        # actions reuse the open connection instead of spinning up a new loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
+        self._poll_task: asyncio.Task | None = None
 
     def _create_client(self) -> AsyncModbusTcpClient | AsyncModbusSerialClient:
         """Create the appropriate Modbus client."""
@@ -220,20 +169,27 @@ class ModbusClient:
             )
 
     def _init_trace_source(self) -> None:
-        """Initialize Zelos trace source and define schema from register map."""
+        """Initialize Zelos trace source, reusing this client's own if the schema is unchanged."""
+        key = _schema_key(self.register_map)
+        if self._source is None or self._source_schema != key:
+            self._source = self._create_trace_source()
+            self._source_schema = key
+
+    def _create_trace_source(self) -> zelos_sdk.TraceSourceCacheLast:
+        """Create a Zelos trace source and define its schema from the register map."""
         source_name = self.register_map.name if self.register_map else "modbus"
-        self._source = zelos_sdk.TraceSourceCacheLast(source_name)
+        source = zelos_sdk.TraceSourceCacheLast(source_name)
 
         if not self.register_map or not self.register_map.events:
             # No register map - create a generic raw event
-            self._source.add_event(
+            source.add_event(
                 "raw",
                 [
                     zelos_sdk.TraceEventFieldMetadata("address", zelos_sdk.DataType.UInt16),
                     zelos_sdk.TraceEventFieldMetadata("value", zelos_sdk.DataType.Int32),
                 ],
             )
-            return
+            return source
 
         # Create events from user-defined event names
         for event_name, regs in self.register_map.events.items():
@@ -242,25 +198,12 @@ class ModbusClient:
 
             fields = []
             for reg in regs:
-                dtype = self._get_sdk_datatype(reg.datatype)
+                dtype = _SDK_DATATYPES.get(reg.datatype, zelos_sdk.DataType.Int32)
                 fields.append(zelos_sdk.TraceEventFieldMetadata(reg.name, dtype, reg.unit))
 
-            self._source.add_event(event_name, fields)
-
-    def _get_sdk_datatype(self, datatype: str) -> zelos_sdk.DataType:
-        """Map register datatype to Zelos SDK DataType."""
-        mapping = {
-            "bool": zelos_sdk.DataType.Boolean,
-            "uint16": zelos_sdk.DataType.UInt16,
-            "int16": zelos_sdk.DataType.Int16,
-            "uint32": zelos_sdk.DataType.UInt32,
-            "int32": zelos_sdk.DataType.Int32,
-            "float32": zelos_sdk.DataType.Float32,
-            "uint64": zelos_sdk.DataType.UInt64,
-            "int64": zelos_sdk.DataType.Int64,
-            "float64": zelos_sdk.DataType.Float64,
-        }
-        return mapping.get(datatype, zelos_sdk.DataType.Int32)
+            source.add_event(event_name, fields)
+
+        return source
 
     async def connect(self) -> bool:
         """Connect to Modbus device.
@@ -273,12 +216,15 @@ class ModbusClient:
             await self._client.connect()
             self._connected = self._client.connected
             if self._connected:
-                logger.info(f"Connected to Modbus {self.transport}://{self._connection_str}")
+                # Log every value again after (re)connecting
+                for read in self._poll_plan or ():
+                    read.reset()
+                logger.info("Connected to Modbus %s://%s", self.transport, self._connection_str)
             else:
-                logger.error(f"Failed to connect to {self._connection_str}")
+                logger.error("Failed to connect to %s", self._connection_str)
             return self._connected
         except Exception as e:
-            logger.error(f"Connection error: {e}")
+            logger.error("Connection error: %s", e)
             self._connected = False
             return False
 
@@ -296,31 +242,53 @@ class ModbusClient:
             return f"{self.host}:{self.port}"
         return f"{self.serial_port}@{self.baudrate}"
 
-    async def read_holding_registers(self, address: int, count: int = 1) -> list[int] | None:
-        """Read holding registers.
+    async def _execute(
+        self, method: str, address: int, writing: bool = False, **kwargs: Any
+    ) -> ModbusPDU | None:
+        """Send a request and unwrap the response, logging any failure.
 
         Args:
-            address: Starting register address
-            count: Number of registers to read
+            method: Name of the pymodbus client request method
+            address: Register address the request targets
+            writing: True for write requests (only affects log messages)
+            **kwargs: Extra request arguments (count, value, values)
 
         Returns:
-            List of register values or None on error
+            The response, or None if not connected or the request failed
         """
         if not self._client or not self._connected:
             return None
 
         try:
-            result = await self._client.read_holding_registers(
-                address=address, count=count, device_id=self.unit_id
+            result = await getattr(self._client, method)(
+                address=address, device_id=self.unit_id, **kwargs
             )
-            if result.isError():
-                logger.warning(f"Read error at address {address}: {result}")
-                return None
-            return list(result.registers)
         except ModbusException as e:
-            logger.error(f"Modbus exception reading {address}: {e}")
+            logger.error(
+                "Modbus exception %s %s: %s", "writing" if writing else "reading", address, e
+            )
             return None
 
+        if result.isError():
+            logger.warning(
+                "%s error at address %s: %s", "Write" if writing else "Read", address, result
+            )
+            return None
+        return result
+
+    async def read_holding_registers(self, address: int, count: int = 1) -> list[int] | None:
+        """Read holding registers.
+
+        Args:
+            address: Starting register address
+            count: Number of registers to read
+
+        Returns:
+            List of register values or None on error
+        """
+        result = await self._execute("read_holding_registers", address, count=count)
+        return result.registers if result is not None else None
+
     async def read_input_registers(self, address: int, count: int = 1) -> list[int] | None:
         """Read input registers.
 
@@ -331,20 +299,8 @@ class ModbusClient:
         Returns:
             List of register values or None on error
         """
-        if not self._client or not self._connected:
-            return None
-
-        try:
-            result = await self._client.read_input_registers(
-                address=address, count=count, device_id=self.unit_id
-            )
-            if result.isError():
-                logger.warning(f"Read error at address {address}: {result}")
-                return None
-            return list(result.registers)
-        except ModbusException as e:
-            logger.error(f"Modbus exception reading {address}: {e}")
-            return None
+        result = await self._execute("read_input_registers", address, count=count)
+        return result.registers if result is not None else None
 
     async def read_coils(self, address: int, count: int = 1) -> list[bool] | None:
         """Read coils.
@@ -356,20 +312,8 @@ class ModbusClient:
         Returns:
             List of coil values or None on error
         """
-        if not self._client or not self._connected:
-            return None
-
-        try:
-            result = await self._client.read_coils(
-                address=address, count=count, device_id=self.unit_id
-            )
-            if result.isError():
-                logger.warning(f"Read error at address {address}: {result}")
-                return None
-            return list(result.bits[:count])
-        except ModbusException as e:
-            logger.error(f"Modbus exception reading {address}: {e}")
-            return None
+        result = await self._execute("read_coils", address, count=count)
+        return result.bits[:count] if result is not None else None
 
     async def read_discrete_inputs(self, address: int, count: int = 1) -> list[bool] | None:
         """Read discrete inputs.
@@ -381,20 +325,8 @@ class ModbusClient:
         Returns:
             List of input values or None on error
         """
-        if not self._client or not self._connected:
-            return None
-
-        try:
-            result = await self._client.read_discrete_inputs(
-                address=address, count=count, device_id=self.unit_id
-            )
-            if result.isError():
-                logger.warning(f"Read error at address {address}: {result}")
-                return None
-            return list(result.bits[:count])
-        except ModbusException as e:
-            logger.error(f"Modbus exception reading {address}: {e}")
-            return None
+        result = await self._execute("read_discrete_inputs", address, count=count)
+        return result.bits[:count] if result is not None else None
 
     async def write_register(self, address: int, value: int) -> bool:
         """Write single holding register.
@@ -406,20 +338,8 @@ class ModbusClient:
         Returns:
             True if successful
         """
-        if not self._client or not self._connected:
-            return False
-
-        try:
-            result = await self._client.write_register(
-                address=address, value=value, device_id=self.unit_id
-            )
-            if result.isError():
-                logger.warning(f"Write error at address {address}: {result}")
-                return False
-            return True
-        except ModbusException as e:
-            logger.error(f"Modbus exception writing {address}: {e}")
-            return False
+        result = await self._execute("write_register", address, writing=True, value=value)
+        return result is not None
 
     async def write_registers(self, address: int, values: list[int]) -> bool:
         """Write multiple holding registers.
@@ -431,20 +351,8 @@ class ModbusClient:
         Returns:
             True if successful
         """
-        if not self._client or not self._connected:
-            return False
-
-        try:
-            result = await self._client.write_registers(
-                address=address, values=values, device_id=self.unit_id
-            )
-            if result.isError():
-                logger.warning(f"Write error at address {address}: {result}")
-                return False
-            return True
-        except ModbusException as e:
-            logger.error(f"Modbus exception writing {address}: {e}")
-            return False
+        result = await self._execute("write_registers", address, writing=True, values=values)
+        return result is not None
 
     async def write_coil(self, address: int, value: bool) -> bool:
         """Write single coil.
@@ -456,20 +364,8 @@ class ModbusClient:
         Returns:
             True if successful
         """
-        if not self._client or not self._connected:
-            return False
-
-        try:
-            result = await self._client.write_coil(
-                address=address, value=value, device_id=self.unit_id
-            )
-            if result.isError():
-                logger.warning(f"Write error at address {address}: {result}")
-                return False
-            return True
-        except ModbusException as e:
-            logger.error(f"Modbus exception writing {address}: {e}")
-            return False
+        result = await self._execute("write_coil", address, writing=True, value=value)
+        return result is not None
 
     async def read_register_value(self, register: Register) -> float | int | bool | None:
         """Read and decode a register using its definition.
@@ -480,23 +376,23 @@ class ModbusClient:
         Returns:
             Decoded value or None on error
         """
-        if register.type == "holding":
-            raw = await self.read_holding_registers(register.address, register.count)
-        elif register.type == "input":
-            raw = await self.read_input_registers(register.address, register.count)
-        elif register.type == "coil":
-            result = await self.read_coils(register.address, 1)
-            return result[0] if result else None
-        elif register.type == "discrete_input":
-            result = await self.read_discrete_inputs(register.address, 1)
-            return result[0] if result else None
-        else:
+        raw = await self._read_raw(register)
+        if not raw:
             return None
 
-        if raw is None:
-            return None
+        return raw[0] if register._is_bit else register._decode(raw)
 
-        return decode_value(raw, register.datatype, register.scale, register.byte_order)
+    async def _read_raw(self, register: Register) -> list[int] | list[bool] | None:
+        """Read the raw words (or single bit) backing a register definition.
+
+        Args:
+            register: Register definition
+
+        Returns:
+            Raw register or bit values, or None on error
+        """
+        read = self._readers[register.type]
+        return await read(register.address, 1 if register._is_bit else register.count)
 
     async def write_register_value(self, register: Register, value: float | int | bool) -> bool:
         """Write a value to a register using its definition.
@@ -506,44 +402,149 @@ class ModbusClient:
             value: Value to write
 
         Returns:
-            True if successful
+            True if successful; False if the register is read-only or the value
+            is out of range for its datatype
         """
         if not register.writable:
-            logger.warning(f"Register '{register.name}' is not writable (type: {register.type})")
+            logger.warning("Register '%s' is not writable (type: %s)", register.name, register.type)
             return False
 
-        if register.type == "coil":
+        if register._is_bit:
             return await self.write_coil(register.address, bool(value))
 
-        raw = encode_value(value, register.datatype, register.scale, register.byte_order)
+        try:
+            raw = register._encode(value)
+        except ValueError as e:
+            logger.error("Cannot write register '%s': %s", register.name, e)
+            return False
 
         if len(raw) == 1:
             return await self.write_register(register.address, raw[0])
         else:
             return await self.write_registers(register.address, raw)
 
+    def _build_poll_plan(self) -> None:
+        """Preallocate the per-event result dicts and the list of read requests.
+
+        Events whose registers form one contiguous block of a single word type are
+        read with one request and decoded with one unpack. The other registers
+        are grouped by type and coalesced into requests over contiguous
+        addresses with `RegisterMap.plan_reads`.
+        """
+        register_map = self.register_map
+        events = register_map.events if register_map else {}
+        self._poll_results = {event_name: {} for event_name, regs in events.items() if regs}
+        plan = []
+        # (event values, register) per register type, for registers not in a block
+        loose: dict[str, list[tuple[dict[str, Any], Register]]] = {}
+        for event_name, event in events.items():
+            event_values = self._poll_results.get(event_name)
+            if event_values is None:
+                continue
+            block = event.block
+            if block is not None:
+                plan.append(
+                    _PollRead(
+                        block.register_type, block.start, block.count, block=(event_values, block)
+                    )
+                )
+                continue
+            for reg in event:
+                loose.setdefault(reg.type, []).append((event_values, reg))
+
+        for register_type, entries in loose.items():
+            entries.sort(key=lambda entry: entry[1].address)
+            regs = [reg for _, reg in entries]
+            i = 0
+            for start, count in register_map.plan_reads(register_type, registers=regs):
+                # Blocks cover the sorted registers in order; take those inside this one
+                j = i
+                while j < len(entries) and entries[j][1].address < start + count:
+                    j += 1
+                fields = tuple((values, reg, reg.address - start) for values, reg in entries[i:j])
+                plan.append(_PollRead(register_type, start, count, fields=fields))
+                i = j
+
+        for read in plan:
+            read.reset()
+        self._poll_plan = tuple(plan)
+
     async def _poll_registers(self) -> dict[str, dict[str, Any]]:
         """Poll all registers in the register map.
 
+        Only fields whose value changed since the previous poll are returned; the
+        trace source caches the last value of everything else. The returned
+        dictionaries are reused and updated in place on every poll.
+
         Returns:
             Dictionary of {event_name: {field_name: value}}
         """
         if not self.register_map:
             return {}
 
-        results: dict[str, dict[str, Any]] = {}
+        if self._poll_plan is None:
+            self._build_poll_plan()
+        plan = self._poll_plan
+        readers = self._readers
 
-        for event_name, regs in self.register_map.events.items():
-            event_results: dict[str, Any] = {}
-            for reg in regs:
-                value = await self.read_register_value(reg)
-                if value is not None:
-                    event_results[reg.name] = value
+        # A read that raises is treated like a failed (None) read, so one bad
+        # request doesn't abort the poll or leave sibling reads unawaited
+        raws: list[Any]
+        if self.transport == "tcp":
+            # Issue all reads at once so per-request setup overlaps with wire time;
+            # pymodbus serializes transactions on the connection itself.
+            raws = await asyncio.gather(
+                *(readers[read.register_type](read.start, read.count) for read in plan),
+                return_exceptions=True,
+            )
+        else:
+            # RTU is a half-duplex bus - keep a single request in flight
+            raws = []
+            for read in plan:
+                try:
+                    raws.append(await readers[read.register_type](read.start, read.count))
+                except Exception as e:
+                    raws.append(e)
 
-            if event_results:
-                results[event_name] = event_results
+        for event_values in self._poll_results.values():
+            event_values.clear()
 
-        return results
+        for read, raw in zip(plan, raws, strict=True):
+            if isinstance(raw, BaseException):
+                self._read_failed(read, raw)
+                continue
+            if not raw or raw == read.last_raw:
+                continue
+            read.last_raw = raw
+            last = read.last
+            if read.block is not None:
+                event_values, block = read.block
+                values = block.decoder(raw)
+                for i, (name, value) in enumerate(zip(block.field_names, values, strict=True)):
+                    if value != last[i]:
+                        event_values[name] = value
+                read.last = list(values)
+                continue
+            for i, (event_values, reg, offset) in enumerate(read.fields):
+                words = raw[offset : offset + (1 if reg._is_bit else reg.count)]
+                if words == last[i]:
+                    continue
+                last[i] = words
+                event_values[reg.name] = words[0] if reg._is_bit else reg._decode(words)
+
+        return self._poll_results
+
+    def _read_failed(self, read: _PollRead, error: BaseException) -> None:
+        """Record a poll read that raised, flagging the connection if it looks lost.
+
+        Args:
+            read: The read request that failed
+            error: Exception raised by the read
+        """
+        self._error_count += 1
+        logger.error("Error reading %s %s: %s", read.register_type, read.start, error)
+        if isinstance(error, Exception) and self._is_connection_error(error):
+            self._connected = False
 
     async def _log_values(self, values: dict[str, dict[str, Any]]) -> None:
         """Log polled values to Zelos trace source.
@@ -563,19 +564,79 @@ class ModbusClient:
                 event.log(**event_values)
 
     def start(self) -> None:
-        """Start the client (initialize trace source)."""
+        """Start the client (initialize trace source and event loop)."""
         self._running = True
         self._init_trace_source()
+        self._build_poll_plan()
+        self._ensure_loop()
         logger.info("ModbusClient started")
 
     def stop(self) -> None:
-        """Stop the client."""
+        """Stop the client, closing the connection and the event loop."""
         self._running = False
+
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            with contextlib.suppress(Exception):
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(
+                    timeout=self.timeout
+                )
+            loop.call_soon_threadsafe(loop.stop)
+            if self._loop_thread and self._loop_thread is not threading.current_thread():
+                self._loop_thread.join(timeout=1.0)
+                if not self._loop_thread.is_alive():
+                    loop.close()
+
         logger.info("ModbusClient stopped")
 
     def run(self) -> None:
         """Run the polling loop (blocking)."""
-        asyncio.run(self._run_async())
+        future = asyncio.run_coroutine_threadsafe(self._run_async(), self._ensure_loop())
+        with contextlib.suppress(concurrent.futures.CancelledError):
+            future.result()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread if it is not running yet.
+
+        Returns:
+            The client's event loop
+        """
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                # uvloop, when installed, cuts per-task and socket I/O overhead
+                self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="modbus-client-loop", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def _run_coroutine(self, coro: Coroutine[Any, Any, T]) -> T | None:
+        """Run a coroutine on the client's event loop and wait for the result.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Coroutine result, or None if it did not finish within the timeout
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return future.result(timeout=self.timeout + 1)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.warning("Request timed out after %ss", self.timeout + 1)
+            return None
+
+    async def _shutdown(self) -> None:
+        """Cancel the polling loop (which disconnects on exit) or just disconnect."""
+        task = self._poll_task
+        if task and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        else:
+            await self.disconnect()
 
     async def _ensure_connected(self) -> bool:
         """Ensure connection is established, reconnecting if needed.
@@ -592,18 +653,19 @@ class ModbusClient:
             with contextlib.suppress(Exception):
                 self._client.close()
 
-        logger.info(f"Connecting to {self._connection_str}...")
+        logger.info("Connecting to %s...", self._connection_str)
         return await self.connect()
 
     async def _run_async(self) -> None:
         """Async polling loop with automatic reconnection."""
         reconnect_interval = 3.0  # seconds between reconnect attempts
+        self._poll_task = asyncio.current_task()
 
         try:
             while self._running:
                 # Ensure we're connected
                 if not await self._ensure_connected():
-                    logger.warning(f"Connection failed, retrying in {reconnect_interval}s...")
+                    logger.warning("Connection failed, retrying in %ss...", reconnect_interval)
                     await asyncio.sleep(reconnect_interval)
                     continue
 
@@ -614,11 +676,11 @@ class ModbusClient:
                     self._poll_count += 1
 
                     if self._poll_count % 10 == 0:
-                        logger.debug(f"Poll #{self._poll_count}: {values}")
+                        logger.debug("Poll #%d: %s", self._poll_count, values)
 
                 except Exception as e:
                     self._error_count += 1
-                    logger.error(f"Poll error: {e}")
+                    logger.error("Poll error: %s", e)
 
                     # Check if this looks like a connection error
                     if self._is_connection_error(e):
@@ -675,16 +737,10 @@ class ModbusClient:
         async def _read() -> list | None:
             if not self._connected:
                 await self.connect()
-            if reg_type == "holding":
-                return await self.read_holding_registers(int(address), int(count))
-            elif reg_type == "input":
-                return await self.read_input_registers(int(address), int(count))
-            elif reg_type == "coil":
-                return await self.read_coils(int(address), int(count))
-            else:  # discrete_input
-                return await self.read_discrete_inputs(int(address), int(count))
-
-        result = asyncio.run(_read())
+            read = self._readers.get(reg_type, self.read_discrete_inputs)
+            return await read(int(address), int(count))
+
+        result = self._run_coroutine(_read())
         return {
             "address": address,
             "type": reg_type,
@@ -704,7 +760,7 @@ class ModbusClient:
                 await self.connect()
             return await self.write_register(int(address), int(value))
 
-        success = asyncio.run(_write())
+        success = bool(self._run_coroutine(_write()))
         return {
             "address": address,
             "value": value,
@@ -727,7 +783,7 @@ class ModbusClient:
                 await self.connect()
             return await self.read_register_value(reg)
 
-        value = asyncio.run(_read())
+        value = self._run_coroutine(_read())
         return {
             "name": name,
             "address": reg.address,
@@ -754,7 +810,7 @@ class ModbusClient:
                 "writable": r.writable,
                 "byte_order": r.byte_order,
             }
-            for r in self.register_map.registers
+            for r in self.register_map.iter_registers()
         ]
         return {"registers": regs, "count": len(regs)}
 
@@ -781,7 +837,7 @@ class ModbusClient:
                 await self.connect()
             return await self.write_register_value(reg, value)
 
-        success = asyncio.run(_write())
+        success = bool(self._run_coroutine(_write()))
         return {
             "name": name,
             "address": reg.address,
@@ -804,7 +860,7 @@ class ModbusClient:
                 await self.connect()
             return await self.write_coil(int(address), bool_value)
 
-        success = asyncio.run(_write())
+        success = bool(self._run_coroutine(_write()))
         return {
             "address": address,
             "value": bool_value,
@@ -0,0 +1,355 @@
+"""Conversion between typed values and raw 16-bit Modbus register words.
+
+A register's datatype, scale and byte order are fixed once its definition is
+loaded, so decoding and encoding are specialized up front: `make_decoder` and
+`make_encoder` return a small closure per definition that captures the word
+order and scale factor. Integer types are assembled with shifts and masks; only
+floats go through a precompiled `struct.Struct`. The per-poll hot path is then a
+single call with no datatype dispatch.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zelos_extension_modbus.register_map import Register
+
+Decoder = Callable[[Sequence[int]], float | int | bool]
+Encoder = Callable[[float | int | bool], list[int]]
+
+# Integer datatypes: (register count, signed)
+_INT_LAYOUTS = {
+    "uint16": (1, False),
+    "int16": (1, True),
+    "uint32": (2, False),
+    "int32": (2, True),
+    "uint64": (4, False),
+    "int64": (4, True),
+}
+
+# Big-endian struct formats for float datatypes, which need a real bit reinterpret
+_FLOAT_FORMATS = {"float32": ">f", "float64": ">d"}
+
+# Precompiled structs shared by every float codec
+_FLOAT_STRUCTS = {fmt: struct.Struct(fmt) for fmt in _FLOAT_FORMATS.values()}
+# Raw 16-bit words by register count
+_WORD_STRUCTS = {2: struct.Struct(">HH"), 4: struct.Struct(">HHHH")}
+
+
+def _reorder_registers(registers: list[int], byte_order: str, for_decode: bool = True) -> list[int]:
+    """Reorder registers based on byte order.
+
+    Args:
+        registers: List of 16-bit register values
+        byte_order: One of 'big', 'little', 'big_swap', 'little_swap'
+        for_decode: True if preparing for decode, False for encode
+
+    Returns:
+        Reordered register list
+    """
+    if len(registers) <= 1:
+        return registers
+
+    regs = list(registers)
+
+    if byte_order == "big":
+        # Standard Modbus: AB CD (no change)
+        pass
+    elif byte_order == "little":
+        # Full little endian: DC BA (reverse all)
+        regs = regs[::-1]
+    elif byte_order == "big_swap":
+        # Big endian with word swap: CD AB (swap pairs)
+        if len(regs) == 2:
+            regs = [regs[1], regs[0]]
+        elif len(regs) == 4:
+            regs = [regs[1], regs[0], regs[3], regs[2]]
+    elif byte_order == "little_swap":
+        # Little endian with word swap: BA DC
+        if len(regs) == 2:
+            regs = [regs[1], regs[0]]
+        elif len(regs) == 4:
+            regs = [regs[3], regs[2], regs[1], regs[0]]
+
+    return regs
+
+
+def _word_order(count: int, byte_order: str, for_decode: bool) -> tuple[int, ...]:
+    """Index permutation that _reorder_registers applies for a register count."""
+    return tuple(_reorder_registers(list(range(count)), byte_order, for_decode))
+
+
+def _make_int_decoder(count: int, signed: bool, order: tuple[int, ...]) -> Decoder:
+    """Build a decoder that assembles an integer from 16-bit words with shifts."""
+    if count == 1:
+        if not signed:
+            return lambda regs: regs[0]
+
+        def decode(regs: Sequence[int]) -> int:
+            v = regs[0]
+            return v - 0x10000 if v & 0x8000 else v
+
+    elif count == 2:
+        a, b = order
+        if not signed:
+            return lambda regs: (regs[a] << 16) | regs[b]
+
+        def decode(regs: Sequence[int]) -> int:
+            v = (regs[a] << 16) | regs[b]
+            return v - 0x100000000 if v & 0x80000000 else v
+
+    else:
+        a, b, c, d = order
+        if not signed:
+            return lambda regs: (regs[a] << 48) | (regs[b] << 32) | (regs[c] << 16) | regs[d]
+
+        def decode(regs: Sequence[int]) -> int:
+            v = (regs[a] << 48) | (regs[b] << 32) | (regs[c] << 16) | regs[d]
+            return v - 0x10000000000000000 if v & 0x8000000000000000 else v
+
+    return decode
+
+
+def _make_float_decoder(fmt: str, order: tuple[int, ...]) -> Decoder:
+    """Build a decoder that reinterprets 16-bit words as an IEEE 754 float."""
+    unpack = _FLOAT_STRUCTS[fmt].unpack
+    pack = _WORD_STRUCTS[len(order)].pack
+    if len(order) == 2:
+        a, b = order
+        return lambda regs: unpack(pack(regs[a], regs[b]))[0]
+
+    a, b, c, d = order
+    return lambda regs: unpack(pack(regs[a], regs[b], regs[c], regs[d]))[0]
+
+
+def make_decoder(datatype: str, scale: float = 1.0, byte_order: str = "big") -> Decoder:
+    """Build a decoder specialized for one register definition.
+
+    Args:
+        datatype: Data type string
+        scale: Scale factor to apply
+        byte_order: Byte order ('big', 'little', 'big_swap', 'little_swap')
+
+    Returns:
+        Function mapping raw register values to the decoded, scaled value
+    """
+    if datatype == "bool":
+        return lambda regs: bool(regs[0])
+
+    if datatype in _INT_LAYOUTS:
+        count, signed = _INT_LAYOUTS[datatype]
+        raw = _make_int_decoder(count, signed, _word_order(count, byte_order, for_decode=True))
+        cast = int
+    elif datatype in _FLOAT_FORMATS:
+        fmt = _FLOAT_FORMATS[datatype]
+        count = struct.calcsize(fmt) // 2
+        raw = _make_float_decoder(fmt, _word_order(count, byte_order, for_decode=True))
+        cast = float
+    else:
+        return lambda regs: regs[0]
+
+    if scale == 1.0:
+        return raw
+    return lambda regs: cast(raw(regs) * scale)
+
+
+def make_encoder(datatype: str, scale: float = 1.0, byte_order: str = "big") -> Encoder:
+    """Build an encoder specialized for one register definition.
+
+    Args:
+        datatype: Data type string
+        scale: Scale factor (values will be divided by scale)
+        byte_order: Byte order ('big', 'little', 'big_swap', 'little_swap')
+
+    Returns:
+        Function mapping a value to its list of 16-bit register values; integer
+        encoders raise ValueError for values outside the datatype's range
+    """
+    if datatype == "bool":
+        return lambda value: [1 if value else 0]
+
+    inv_scale = 1.0 / scale if scale else 1.0
+    unity = scale == 1.0
+
+    if datatype in _INT_LAYOUTS:
+        count, signed = _INT_LAYOUTS[datatype]
+        bits = 16 * count
+        lo = -(1 << (bits - 1)) if signed else 0
+        hi = (1 << (bits - 1)) - 1 if signed else (1 << bits) - 1
+        # Two's complement falls out of masking each shifted word
+        order = _word_order(count, byte_order, for_decode=False)
+        shifts = tuple(16 * (count - 1 - i) for i in order)
+
+        def encode_int(value: float | int | bool) -> list[int]:
+            v = int(value) if unity else int(value * inv_scale)
+            if not lo <= v <= hi:
+                # Masking would silently write a wrapped value to the device
+                raise ValueError(f"Value {v} out of range for {datatype} ({lo}..{hi})")
+            if count == 1:
+                return [v & 0xFFFF]
+            return [(v >> s) & 0xFFFF for s in shifts]
+
+        return encode_int
+
+    if datatype not in _FLOAT_FORMATS:
+        return lambda value: [int(value) & 0xFFFF]
+
+    value_struct = _FLOAT_STRUCTS[_FLOAT_FORMATS[datatype]]
+    count = value_struct.size // 2
+    pack = value_struct.pack
+    unpack = _WORD_STRUCTS[count].unpack
+    order = _word_order(count, byte_order, for_decode=False)
+
+    if order == tuple(range(count)):
+        if unity:
+            return lambda value: list(unpack(pack(float(value))))
+        return lambda value: list(unpack(pack(float(value * inv_scale))))
+
+    def encode(value: float | int | bool) -> list[int]:
+        words = unpack(pack(float(value if unity else value * inv_scale)))
+        return [words[i] for i in order]
+
+    return encode
+
+
+# Big-endian struct codes per datatype, for decoding several values in one unpack
+_STRUCT_CODES = {
+    "bool": "H",
+    "uint16": "H",
+    "int16": "h",
+    "uint32": "I",
+    "int32": "i",
+    "uint64": "Q",
+    "int64": "q",
+    "float32": "f",
+    "float64": "d",
+}
+
+BlockDecoder = Callable[[Sequence[int]], tuple[float | int | bool, ...]]
+
+
+def make_block_decoder(fields: Sequence[tuple[str, float, str]], count: int) -> BlockDecoder:
+    """Build a decoder for several values laid out in one contiguous word block.
+
+    The whole block is reinterpreted with a single precompiled `struct.Struct`.
+    Fields stored in big byte order come straight out of the unpack; word-swapped
+    fields are unpacked as raw words and finished by their own decoder, and
+    scaled fields are multiplied afterwards.
+
+    Args:
+        fields: (datatype, scale, byte_order) per value, in address order with
+            no gaps between them
+        count: Total number of words in the block
+
+    Returns:
+        Function mapping the block's words to the decoded values, in field order
+    """
+    fmt = [">"]
+    finishers: list[tuple[int, int, Callable[..., float | int | bool] | None]] = []
+    slot = 0  # index into the unpacked tuple
+    for datatype, scale, byte_order in fields:
+        words = struct.calcsize(">" + _STRUCT_CODES[datatype]) // 2
+        if byte_order != "big" and words > 1:
+            # Keep the raw words and let the specialized decoder reorder them
+            fmt.append(f"{words}H")
+            finishers.append((slot, words, make_decoder(datatype, scale, byte_order)))
+            slot += words
+        else:
+            fmt.append(_STRUCT_CODES[datatype])
+            if datatype == "bool":
+                finishers.append((slot, 1, bool))
+            elif scale != 1.0:
+                cast = float if datatype in _FLOAT_FORMATS else int
+                finishers.append((slot, 1, lambda v, c=cast, s=scale: c(v * s)))
+            else:
+                finishers.append((slot, 1, None))
+            slot += 1
+
+    pack = struct.Struct(f">{count}H").pack
+    unpack = struct.Struct("".join(fmt)).unpack
+
+    def decode(regs: Sequence[int]) -> tuple[float | int | bool, ...]:
+        flat = unpack(pack(*regs))
+        out = []
+        for slot, width, finish in finishers:
+            if finish is None:
+                out.append(flat[slot])
+            elif width == 1:
+                out.append(finish(flat[slot]))
+            else:
+                out.append(finish(flat[slot : slot + width]))
+        return tuple(out)
+
+    return decode
+
+
+# Codecs depend only on (datatype, scale, byte_order), so registers, event blocks
+# and decode_value/encode_value all share one closure per distinct definition
+_cached_decoder = lru_cache(maxsize=256)(make_decoder)
+_cached_encoder = lru_cache(maxsize=256)(make_encoder)
+# Keyed by the tuple of (datatype, scale, byte_order) fields and the word count
+_cached_block_decoder = lru_cache(maxsize=256)(make_block_decoder)
+
+
+def decode_value(
+    registers: Sequence[int], datatype: str, scale: float = 1.0, byte_order: str = "big"
+) -> float | int | bool:
+    """Decode raw register values to typed value.
+
+    Args:
+        registers: List of 16-bit register values
+        datatype: Data type string
+        scale: Scale factor to apply
+        byte_order: Byte order ('big', 'little', 'big_swap', 'little_swap')
+
+    Returns:
+        Decoded and scaled value
+    """
+    return _cached_decoder(datatype, scale, byte_order)(registers)
+
+
+def encode_value(
+    value: float | int | bool, datatype: str, scale: float = 1.0, byte_order: str = "big"
+) -> list[int]:
+    """Encode typed value to raw register values.
+
+    Args:
+        value: Value to encode
+        datatype: Data type string
+        scale: Scale factor (value will be divided by scale)
+        byte_order: Byte order ('big', 'little', 'big_swap', 'little_swap')
+
+    Returns:
+        List of 16-bit register values
+    """
+    return _cached_encoder(datatype, scale, byte_order)(value)
+
+
+def decode_register(register: Register, registers: Sequence[int]) -> float | int | bool:
+    """Decode raw register values using a register definition.
+
+    Args:
+        register: Register definition
+        registers: List of 16-bit register values
+
+    Returns:
+        Decoded and scaled value
+    """
+    return register._decode(registers)
+
+
+def encode_register(register: Register, value: float | int | bool) -> list[int]:
+    """Encode a value using a register definition.
+
+    Args:
+        register: Register definition
+        value: Value to encode
+
+    Returns:
+        List of 16-bit register values
+    """
+    return register._encode(value)
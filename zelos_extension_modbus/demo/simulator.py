@@ -6,24 +6,27 @@ power meter data that changes over time.
 
 from __future__ import annotations
 
+import array
 import asyncio
+import contextlib
 import logging
 import math
 import random
 import struct
-import threading
 import time
-from typing import TYPE_CHECKING
 
-from pymodbus.datastore import (
-    ModbusDeviceContext,
-    ModbusSequentialDataBlock,
-    ModbusServerContext,
-)
+from pymodbus.datastore import ModbusSequentialDataBlock, ModbusServerContext
 from pymodbus.server import StartAsyncTcpServer
 
-if TYPE_CHECKING:
-    pass
+# pymodbus 3.10 renamed slave contexts to device contexts
+try:
+    from pymodbus.datastore import ModbusDeviceContext
+
+    _SERVER_CONTEXT_KW = "devices"
+except ImportError:
+    from pymodbus.datastore import ModbusSlaveContext as ModbusDeviceContext
+
+    _SERVER_CONTEXT_KW = "slaves"
 
 logger = logging.getLogger(__name__)
 
@@ -66,29 +69,56 @@ ADDR_CAL_FACTOR = 110  # float32 big_swap
 ADDR_OFFSET_VAL = 112  # float32 big_swap
 
 
+# Precompiled struct codecs for the per-tick register conversions
+_F32_PACK = struct.Struct(">f").pack
+_U32_PACK = struct.Struct(">I").pack
+_I32_PACK = struct.Struct(">i").pack
+_HH_UNPACK = struct.Struct(">HH").unpack
+
+# Holding registers 0-20: 9 float32 values, uint32 energy, int16 temperature
+_HR_BLOCK = struct.Struct(">9fIH")
+_HR_WORDS = struct.Struct(f">{_HR_BLOCK.size // 2}H")
+
+
 def float32_to_registers(value: float) -> tuple[int, int]:
     """Convert float32 to two 16-bit registers (big-endian)."""
-    packed = struct.pack(">f", value)
-    return struct.unpack(">HH", packed)
+    b = _F32_PACK(value)
+    return (b[0] << 8 | b[1], b[2] << 8 | b[3])
 
 
 def uint32_to_registers(value: int) -> tuple[int, int]:
     """Convert uint32 to two 16-bit registers (big-endian)."""
-    packed = struct.pack(">I", value)
-    return struct.unpack(">HH", packed)
+    return _HH_UNPACK(_U32_PACK(value))
 
 
 def int32_to_registers(value: int) -> tuple[int, int]:
     """Convert int32 to two 16-bit registers (big-endian)."""
-    packed = struct.pack(">i", value)
-    return struct.unpack(">HH", packed)
+    return _HH_UNPACK(_I32_PACK(value))
 
 
 def float32_to_registers_swapped(value: float) -> tuple[int, int]:
     """Convert float32 to two 16-bit registers (big-endian word-swapped)."""
-    packed = struct.pack(">f", value)
-    r1, r2 = struct.unpack(">HH", packed)
-    return (r2, r1)  # Swap words
+    b = _F32_PACK(value)
+    return (b[2] << 8 | b[3], b[0] << 8 | b[1])
+
+
+# One period of sine for the voltage phases; demo values don't need exact sin()
+_SIN_LUT_SIZE = 4096
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT = array.array(
+    "d", (math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE))
+)
+_LUT_STEPS_PER_RADIAN = _SIN_LUT_SIZE / (2 * math.pi)
+# L2/L3 are offset from L1 by one and two thirds of a period
+_LUT_PHASE_L2 = round(_SIN_LUT_SIZE / 3)
+_LUT_PHASE_L3 = round(2 * _SIN_LUT_SIZE / 3)
+
+# Per-tick probability that the demo door input flips
+_DOOR_FLIP_P = 0.01
+_LOG_DOOR_STAY = math.log(1.0 - _DOOR_FLIP_P)
+
+# kW * s -> Wh
+_KW_SECONDS_TO_WH = 1000.0 / 3600.0
 
 
 class PowerMeterSimulator:
@@ -96,7 +126,7 @@ class PowerMeterSimulator:
 
     def __init__(self) -> None:
         """Initialize simulator state."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # Base values (typical industrial 3-phase)
         self.nominal_voltage = 230.0  # V line-to-neutral
@@ -117,6 +147,10 @@ class PowerMeterSimulator:
         self.relay2 = False
         self.alarm = False
 
+        # Per-simulator RNG for current noise, bound once for the update loop
+        self._rng = random.Random()
+        self._gauss = self._rng.gauss
+
     def update(self, dt: float) -> dict:
         """Update simulation state and return current values.
 
@@ -126,23 +160,28 @@ class PowerMeterSimulator:
         Returns:
             Dictionary of current register values
         """
-        t = time.time() - self.start_time
+        sin = math.sin
+        v_nominal = self.nominal_voltage
+        base_load = self.base_load
+        t = time.monotonic() - self.start_time
 
-        # Voltage with slight variation and phase offset
-        voltage_l1 = self.nominal_voltage * (1.0 + 0.02 * math.sin(t * 0.1))
-        voltage_l2 = self.nominal_voltage * (1.0 + 0.02 * math.sin(t * 0.1 + 2.094))
-        voltage_l3 = self.nominal_voltage * (1.0 + 0.02 * math.sin(t * 0.1 + 4.189))
+        # Voltage with slight variation and phase offset, from the sine table
+        ix = int(t * 0.1 * _LUT_STEPS_PER_RADIAN)
+        voltage_l1 = v_nominal * (1.0 + 0.02 * _SIN_LUT[ix & _SIN_LUT_MASK])
+        voltage_l2 = v_nominal * (1.0 + 0.02 * _SIN_LUT[(ix + _LUT_PHASE_L2) & _SIN_LUT_MASK])
+        voltage_l3 = v_nominal * (1.0 + 0.02 * _SIN_LUT[(ix + _LUT_PHASE_L3) & _SIN_LUT_MASK])
 
         # Current with load variation (simulates varying industrial load)
-        load_factor = 1.0 + 0.3 * math.sin(t * 0.05)  # Slow load cycle
-        noise = random.gauss(0, 0.05)
+        load_factor = 1.0 + 0.3 * sin(t * 0.05)  # Slow load cycle
+        gauss = self._gauss
+        phase_load = base_load * load_factor
 
-        current_l1 = max(0, self.base_load * load_factor * (1.0 + noise))
-        current_l2 = max(0, self.base_load * load_factor * (1.0 + random.gauss(0, 0.05)))
-        current_l3 = max(0, self.base_load * load_factor * (1.0 + random.gauss(0, 0.05)))
+        current_l1 = max(0, phase_load * (1.0 + gauss(0, 0.05)))
+        current_l2 = max(0, phase_load * (1.0 + gauss(0, 0.05)))
+        current_l3 = max(0, phase_load * (1.0 + gauss(0, 0.05)))
 
         # Power calculation (3-phase)
-        power_factor = 0.85 + 0.1 * math.sin(t * 0.02)  # Varies 0.75-0.95
+        power_factor = 0.85 + 0.1 * sin(t * 0.02)  # Varies 0.75-0.95
         power_total = (
             (voltage_l1 * current_l1 + voltage_l2 * current_l2 + voltage_l3 * current_l3)
             * power_factor
@@ -150,17 +189,18 @@ class PowerMeterSimulator:
         )  # kW
 
         # Frequency with tiny drift
-        frequency = self.nominal_frequency + 0.05 * math.sin(t * 0.3)
+        frequency = self.nominal_frequency + 0.05 * sin(t * 0.3)
 
         # Accumulate energy
-        self.energy_total += power_total * dt / 3600.0 * 1000  # Wh
+        self.energy_total += power_total * dt * _KW_SECONDS_TO_WH  # Wh
 
         # Temperature rises with load
         avg_current = (current_l1 + current_l2 + current_l3) / 3
-        self.ambient_temp = 25.0 + (avg_current / self.base_load) * 15.0
+        ambient_temp = 25.0 + (avg_current / base_load) * 15.0
+        self.ambient_temp = ambient_temp
 
         # Alarm if over-temperature
-        self.alarm = self.ambient_temp > 50.0
+        self.alarm = ambient_temp > 50.0
 
         return {
             "voltage_l1": voltage_l1,
@@ -173,7 +213,7 @@ class PowerMeterSimulator:
             "power_factor": power_factor,
             "frequency": frequency,
             "energy_total": int(self.energy_total),
-            "temperature": int(self.ambient_temp * 10),  # Scaled
+            "temperature": int(ambient_temp * 10),  # Scaled
             "relay1": self.relay1,
             "relay2": self.relay2,
             "alarm": self.alarm,
@@ -181,7 +221,11 @@ class PowerMeterSimulator:
 
 
 class SimulatorUpdater:
-    """Background thread that updates simulator values in the datastore."""
+    """Asyncio task that updates simulator values in the datastore.
+
+    Runs on the same event loop as the Modbus server, so datastore writes never
+    race with request handlers.
+    """
 
     def __init__(
         self,
@@ -200,116 +244,137 @@ class SimulatorUpdater:
         self.context = context
         self.interval = interval
         self._running = False
-        self._thread: threading.Thread | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._hr_buf = bytearray(_HR_BLOCK.size)
+        # Last blocks written, so unchanged ticks skip the datastore
+        self._last_hr: bytes | None = None
+        self._last_coils: list[bool] | None = None
+        self._last_uptime = -1
+        # Door flips are drawn as a tick countdown instead of a coin toss per tick
+        self._rng = random.Random()
+        self._ticks_to_door_flip = self._draw_door_flip_ticks()
 
     def start(self) -> None:
-        """Start background update thread."""
+        """Start the update task on the running event loop."""
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._task = asyncio.create_task(self._run_async())
         logger.info("Simulator updater started")
 
-    def stop(self) -> None:
-        """Stop background update thread."""
+    async def stop(self) -> None:
+        """Stop the update task and wait for it to finish."""
         self._running = False
-        if self._thread:
-            self._thread.join(timeout=1.0)
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
         logger.info("Simulator updater stopped")
 
-    def _run(self) -> None:
+    async def _run_async(self) -> None:
         """Update loop."""
-        last_time = time.time()
+        loop = asyncio.get_running_loop()
+        last_time = loop.time()
 
         while self._running:
-            now = time.time()
+            now = loop.time()
             dt = now - last_time
             last_time = now
 
             values = self.simulator.update(dt)
             self._update_datastore(values)
 
-            time.sleep(self.interval)
+            await asyncio.sleep(self.interval)
 
     def _update_datastore(self, values: dict) -> None:
         """Write simulator values to Modbus datastore."""
         device = self.context[0]
 
-        # Holding registers (float32 values as register pairs)
+        # Holding registers 0-20 are contiguous, so write them as one block
         hr = device.store["h"]
+        _HR_BLOCK.pack_into(
+            self._hr_buf,
+            0,
+            values["voltage_l1"],
+            values["voltage_l2"],
+            values["voltage_l3"],
+            values["current_l1"],
+            values["current_l2"],
+            values["current_l3"],
+            values["power_total"],
+            values["power_factor"],
+            values["frequency"],
+            values["energy_total"],
+            values["temperature"] & 0xFFFF,  # int16, scaled
+        )
+        if self._hr_buf != self._last_hr:
+            hr.setValues(ADDR_VOLTAGE_L1 + 1, list(_HR_WORDS.unpack_from(self._hr_buf)))
+            self._last_hr = bytes(self._hr_buf)
+
+        # Coils (relay1, relay2, alarm are contiguous)
+        coil_values = [values["relay1"], values["relay2"], values["alarm"]]
+        if coil_values != self._last_coils:
+            device.store["c"].setValues(ADDR_COIL_RELAY1 + 1, coil_values)
+            self._last_coils = coil_values
+
+        # Input registers: uptime in hours, written only when the hour ticks over
+        uptime_hours = int((time.monotonic() - self.simulator.start_time) / 3600)
+        if uptime_hours != self._last_uptime:
+            device.store["i"].setValues(ADDR_IR_UPTIME + 1, list(uint32_to_registers(uptime_hours)))
+            self._last_uptime = uptime_hours
+
+        # Discrete inputs: door randomly opens/closes (1% chance per update)
+        self._ticks_to_door_flip -= 1
+        if self._ticks_to_door_flip <= 0:
+            di = device.store["d"]
+            current = di.getValues(ADDR_DI_DOOR + 1, 1)[0]
+            di.setValues(ADDR_DI_DOOR + 1, [not current])
+            self._ticks_to_door_flip = self._draw_door_flip_ticks()
 
-        # Voltages
-        r1, r2 = float32_to_registers(values["voltage_l1"])
-        hr.setValues(ADDR_VOLTAGE_L1 + 1, [r1, r2])
-
-        r1, r2 = float32_to_registers(values["voltage_l2"])
-        hr.setValues(ADDR_VOLTAGE_L2 + 1, [r1, r2])
-
-        r1, r2 = float32_to_registers(values["voltage_l3"])
-        hr.setValues(ADDR_VOLTAGE_L3 + 1, [r1, r2])
-
-        # Currents
-        r1, r2 = float32_to_registers(values["current_l1"])
-        hr.setValues(ADDR_CURRENT_L1 + 1, [r1, r2])
-
-        r1, r2 = float32_to_registers(values["current_l2"])
-        hr.setValues(ADDR_CURRENT_L2 + 1, [r1, r2])
-
-        r1, r2 = float32_to_registers(values["current_l3"])
-        hr.setValues(ADDR_CURRENT_L3 + 1, [r1, r2])
-
-        # Power
-        r1, r2 = float32_to_registers(values["power_total"])
-        hr.setValues(ADDR_POWER_TOTAL + 1, [r1, r2])
-
-        r1, r2 = float32_to_registers(values["power_factor"])
-        hr.setValues(ADDR_POWER_FACTOR + 1, [r1, r2])
-
-        # Frequency
-        r1, r2 = float32_to_registers(values["frequency"])
-        hr.setValues(ADDR_FREQUENCY + 1, [r1, r2])
-
-        # Energy (uint32)
-        r1, r2 = uint32_to_registers(values["energy_total"])
-        hr.setValues(ADDR_ENERGY_TOTAL + 1, [r1, r2])
-
-        # Temperature (int16, scaled)
-        hr.setValues(ADDR_TEMPERATURE + 1, [values["temperature"] & 0xFFFF])
-
-        # Coils
-        coils = device.store["c"]
-        coils.setValues(ADDR_COIL_RELAY1 + 1, [values["relay1"]])
-        coils.setValues(ADDR_COIL_RELAY2 + 1, [values["relay2"]])
-        coils.setValues(ADDR_COIL_ALARM + 1, [values["alarm"]])
+    def _draw_door_flip_ticks(self) -> int:
+        """Draw the number of ticks until the next door flip.
 
-        # Input registers (read-only values that change over time)
-        ir = device.store["i"]
-        # Uptime in hours (simulated from simulator start time)
-        uptime_hours = int((time.time() - self.simulator.start_time) / 3600)
-        r1, r2 = uint32_to_registers(uptime_hours)
-        ir.setValues(ADDR_IR_UPTIME + 1, [r1, r2])
+        Geometric with p = _DOOR_FLIP_P via the inverse CDF, which matches an
+        independent per-tick check with one random draw per flip.
 
-        # Discrete inputs (simulate occasional changes)
-        di = device.store["d"]
-        # Door randomly opens/closes (1% chance per update)
-        if random.random() < 0.01:
-            current = di.getValues(ADDR_DI_DOOR + 1, 1)[0]
-            di.setValues(ADDR_DI_DOOR + 1, [not current])
+        Returns:
+            Ticks until the next flip (at least 1)
+        """
+        return int(math.log(1.0 - self._rng.random()) / _LOG_DOOR_STAY) + 1
 
 
 def create_demo_context() -> ModbusServerContext:
     """Create Modbus server context with demo datastore."""
-    # Initialize data blocks
+    # Initial values are laid out before the blocks are built. Block index is
+    # Modbus address + 1, matching the device context's address offset.
+    # ModbusSequentialDataBlock copies its values into a list, so plain lists
+    # are used; zeros and bools are shared singletons, costing a pointer per slot.
+
     # Holding registers: 200 registers (to cover setpoints and swapped floats)
-    hr_block = ModbusSequentialDataBlock(0, [0] * 200)
+    hr_initial = [0] * 200
+    hr_initial[ADDR_VOLTAGE_HIGH + 1] = 250  # 250V high limit
+    hr_initial[ADDR_VOLTAGE_LOW + 1] = 210  # 210V low limit
+    hr_initial[ADDR_POWER_LIMIT + 1 : ADDR_POWER_LIMIT + 3] = int32_to_registers(50000)  # 50kW
+    hr_initial[ADDR_ENERGY_RESET + 1 : ADDR_ENERGY_RESET + 3] = uint32_to_registers(0)
+    # Swapped floats: calibration factor and offset value
+    hr_initial[ADDR_CAL_FACTOR + 1 : ADDR_CAL_FACTOR + 3] = float32_to_registers_swapped(1.0)
+    hr_initial[ADDR_OFFSET_VAL + 1 : ADDR_OFFSET_VAL + 3] = float32_to_registers_swapped(0.0)
+    hr_block = ModbusSequentialDataBlock(0, hr_initial)
 
     # Coils: 16 coils
     coil_block = ModbusSequentialDataBlock(0, [False] * 16)
 
-    # Discrete inputs: 16 inputs (initialized after context creation)
-    di_block = ModbusSequentialDataBlock(0, [False] * 16)
+    # Discrete inputs: 16 inputs (read-only booleans)
+    di_initial = [False] * 16
+    di_initial[ADDR_DI_DOOR + 1] = False  # door closed
+    di_initial[ADDR_DI_FAULT + 1] = False  # no fault
+    di_initial[ADDR_DI_GRID + 1] = True  # grid connected
+    di_block = ModbusSequentialDataBlock(0, di_initial)
 
-    # Input registers: 100 registers (initialized after context creation)
-    ir_block = ModbusSequentialDataBlock(0, [0] * 100)
+    # Input registers: 100 registers (read-only)
+    ir_initial = [0] * 100
+    ir_initial[ADDR_IR_FIRMWARE + 1] = 0x0102  # Firmware v1.2
+    ir_initial[ADDR_IR_SERIAL + 1 : ADDR_IR_SERIAL + 3] = uint32_to_registers(12345678)
+    ir_block = ModbusSequentialDataBlock(0, ir_initial)
 
     device = ModbusDeviceContext(
         di=di_block,
@@ -318,33 +383,7 @@ def create_demo_context() -> ModbusServerContext:
         ir=ir_block,
     )
 
-    # Set initial values for setpoints in holding registers
-    # Note: pymodbus 3.x uses 'devices' instead of 'slaves'
-    ctx = ModbusServerContext(devices=device, single=True)
-    hr = ctx[0].store["h"]
-    hr.setValues(ADDR_VOLTAGE_HIGH + 1, [250])  # 250V high limit
-    hr.setValues(ADDR_VOLTAGE_LOW + 1, [210])  # 210V low limit
-    r1, r2 = int32_to_registers(50000)  # 50kW power limit
-    hr.setValues(ADDR_POWER_LIMIT + 1, [r1, r2])
-    r1, r2 = uint32_to_registers(0)  # energy reset counter
-    hr.setValues(ADDR_ENERGY_RESET + 1, [r1, r2])
-    # Swapped floats
-    r1, r2 = float32_to_registers_swapped(1.0)  # calibration factor
-    hr.setValues(ADDR_CAL_FACTOR + 1, [r1, r2])
-    r1, r2 = float32_to_registers_swapped(0.0)  # offset value
-    hr.setValues(ADDR_OFFSET_VAL + 1, [r1, r2])
-
-    # Set initial values for input registers (read-only)
-    ir = ctx[0].store["i"]
-    ir.setValues(ADDR_IR_FIRMWARE + 1, [0x0102])  # Firmware v1.2
-    r1, r2 = uint32_to_registers(12345678)  # Serial number
-    ir.setValues(ADDR_IR_SERIAL + 1, [r1, r2])
-
-    # Set initial values for discrete inputs (read-only booleans)
-    di = ctx[0].store["d"]
-    di.setValues(ADDR_DI_DOOR + 1, [False])  # door closed
-    di.setValues(ADDR_DI_FAULT + 1, [False])  # no fault
-    di.setValues(ADDR_DI_GRID + 1, [True])  # grid connected
+    ctx = ModbusServerContext(**{_SERVER_CONTEXT_KW: device}, single=True)
 
     return ctx
 
@@ -375,4 +414,4 @@ async def run_demo_server(
             address=(host, port),
         )
     finally:
-        updater.stop()
+        await updater.stop()
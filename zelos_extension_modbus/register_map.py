@@ -24,17 +24,65 @@ Optional fields: type (default: holding), datatype (default: uint16), unit, scal
 
 from __future__ import annotations
 
+import array
+import bisect
+import itertools
 import json
 import logging
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn
+
+from zelos_extension_modbus.codec import (
+    BlockDecoder,
+    Decoder,
+    Encoder,
+    _cached_block_decoder,
+    _cached_decoder,
+    _cached_encoder,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else the stdlib parser."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Files larger than this are stream-parsed with ijson when it is installed
+STREAM_THRESHOLD_BYTES = 5 * 1024 * 1024
+
+# Largest single read request per the Modbus spec
+MAX_READ_REGISTERS = 125
+MAX_READ_BITS = 2000
+
 # Supported register types (Modbus protocol)
 REGISTER_TYPES = {"coil", "discrete_input", "input", "holding"}
 
+# Highest register address in the 16-bit Modbus address space
+MAX_ADDRESS = 0xFFFF
+
+# Small integer per register type, packed above the 16-bit address in index keys
+_TYPE_CODES = {"coil": 0, "discrete_input": 1, "input": 2, "holding": 3}
+
+# Register types addressing single bits rather than 16-bit words
+BIT_TYPES = {"coil", "discrete_input"}
+
 # Supported data types and their register counts
 DATATYPES = {
     "bool": 1,
@@ -56,7 +104,23 @@ DATATYPES = {
 BYTE_ORDERS = {"big", "little", "big_swap", "little_swap"}
 
 
-@dataclass
+def _valid_address(address: Any) -> bool:
+    """Check that an address is an int (not a bool or float) in the Modbus range."""
+    return (
+        isinstance(address, int) and not isinstance(address, bool) and 0 <= address <= MAX_ADDRESS
+    )
+
+
+def _raise_bad(label: str, value: Any, allowed: Collection[str]) -> NoReturn:
+    """Raise the validation error for a field value outside its allowed set.
+
+    Kept out of line so the success path of Register validation does no string work.
+    """
+    msg = f"Invalid {label} '{value}'. Must be one of {allowed}"
+    raise ValueError(msg)
+
+
+@dataclass(slots=True, frozen=True)
 class Register:
     """A single Modbus register definition."""
 
@@ -70,39 +134,355 @@ class Register:
     description: str = ""
     writable: bool = True
 
-    @property
-    def count(self) -> int:
-        """Number of 16-bit registers this value spans."""
-        return DATATYPES.get(self.datatype, 1)
+    # Number of 16-bit registers this value spans, derived from datatype
+    count: int = field(init=False, repr=False, compare=False)
+
+    # Codecs specialized for this definition, built once at construction
+    _decode: Decoder = field(init=False, repr=False, compare=False)
+    _encode: Encoder = field(init=False, repr=False, compare=False)
+    _is_bit: bool = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate register definition."""
-        if self.type not in REGISTER_TYPES:
-            msg = f"Invalid register type '{self.type}'. Must be one of {REGISTER_TYPES}"
-            raise ValueError(msg)
-        if self.datatype not in DATATYPES:
-            msg = f"Invalid datatype '{self.datatype}'. Must be one of {list(DATATYPES)}"
-            raise ValueError(msg)
-        if self.byte_order not in BYTE_ORDERS:
-            msg = f"Invalid byte_order '{self.byte_order}'. Must be one of {BYTE_ORDERS}"
+        if not _valid_address(self.address):
+            msg = f"Invalid address {self.address!r}. Must be an integer 0-{MAX_ADDRESS}"
             raise ValueError(msg)
+        # The str checks keep unhashable values from raising TypeError on lookup
+        if type(self.type) is not str or self.type not in REGISTER_TYPES:
+            _raise_bad("register type", self.type, REGISTER_TYPES)
+        if type(self.datatype) is not str or self.datatype not in DATATYPES:
+            _raise_bad("datatype", self.datatype, list(DATATYPES))
+        if type(self.byte_order) is not str or self.byte_order not in BYTE_ORDERS:
+            _raise_bad("byte_order", self.byte_order, BYTE_ORDERS)
+        self._init_derived()
+
+    @classmethod
+    def _unchecked(cls, **kwargs: Any) -> Register:
+        """Build a register from fields that have already been validated.
+
+        Skips the checks in __post_init__; callers must have checked address,
+        type, datatype and byte_order themselves.
+
+        Args:
+            **kwargs: Register init fields; omitted ones take their defaults
+
+        Returns:
+            Register instance
+        """
+        reg = object.__new__(cls)
+        set_field = object.__setattr__
+        for name, value in _REGISTER_DEFAULTS.items():
+            set_field(reg, name, kwargs.get(name, value))
+        set_field(reg, "address", kwargs["address"])
+        set_field(reg, "name", kwargs["name"])
+        reg._init_derived()
+        return reg
+
+    def _init_derived(self) -> None:
+        """Set the fields derived from the definition."""
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        set_field = object.__setattr__
         # Input registers and discrete inputs are read-only by Modbus spec
         if self.type in ("input", "discrete_input"):
-            self.writable = False
+            set_field(self, "writable", False)
+        set_field(self, "_is_bit", self.type in BIT_TYPES)
+        set_field(self, "count", DATATYPES[self.datatype])
+        # Shared per (datatype, scale, byte_order) rather than built per register
+        set_field(self, "_decode", _cached_decoder(self.datatype, self.scale, self.byte_order))
+        set_field(self, "_encode", _cached_encoder(self.datatype, self.scale, self.byte_order))
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        """Pickle only the definition; the codec closures can't be pickled."""
+        return tuple(getattr(self, f.name) for f in fields(self) if f.init)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        """Restore the definition and re-resolve the derived fields."""
+        set_field = object.__setattr__
+        for f, value in zip((f for f in fields(self) if f.init), state, strict=True):
+            set_field(self, f.name, value)
+        self._init_derived()
+
+
+# Constructor arguments accepted from register map JSON
+_REGISTER_FIELDS = frozenset(f.name for f in fields(Register) if f.init)
+# Init fields without defaults
+_REQUIRED_FIELDS = frozenset({"address", "name"})
+# Defaults of the optional init fields, for Register._unchecked
+_REGISTER_DEFAULTS = {
+    f.name: f.default for f in fields(Register) if f.init and f.default is not MISSING
+}
+
+# Enumerated fields with a handful of values, interned process-wide
+_INTERNED_FIELDS = frozenset({"type", "datatype", "byte_order"})
+# Free-text fields deduplicated within one map
+_SHARED_TEXT_FIELDS = frozenset({"unit", "description"})
+# Shared result for lookups that miss, so they don't allocate
+_EMPTY: tuple[Register, ...] = ()
+
+
+# Parsed maps by resolved path: (mtime_ns, size, map). One entry per file. The
+# cached maps are private templates; callers get copies so edits don't leak.
+_MAP_CACHE: dict[str, tuple[int, int, RegisterMap]] = {}
+
+
+def _parse_registers(
+    registers_data: list[dict[str, Any]], text_cache: dict[str, str]
+) -> list[Register]:
+    """Build Register objects for one event's JSON entries.
+
+    Args:
+        registers_data: Raw register dicts from the map
+        text_cache: Per-map cache used to share unit/description strings
+
+    Returns:
+        Registers in definition order
+    """
+    intern = sys.intern
+    share = text_cache.setdefault
+    records = []
+    append = records.append
+    for reg_data in registers_data:
+        # Unknown keys are ignored; omitted ones take the dataclass defaults
+        kwargs = {k: reg_data[k] for k in reg_data.keys() & _REGISTER_FIELDS}
+        # Only strings are interned/shared; anything else is left for validation
+        # to reject with the usual ValueError
+        for key in _INTERNED_FIELDS & kwargs.keys():
+            if type(kwargs[key]) is str:
+                kwargs[key] = intern(kwargs[key])
+        for key in _SHARED_TEXT_FIELDS & kwargs.keys():
+            if type(kwargs[key]) is str:
+                kwargs[key] = share(kwargs[key], kwargs[key])
+        append(kwargs)
+
+    # Validate the distinct values once for the whole event. On failure, fall
+    # back to the checked constructor so the offending entry raises as usual.
+    if not _records_valid(records):
+        return [Register(**kwargs) for kwargs in records]
+    unchecked = Register._unchecked
+    return [unchecked(**kwargs) for kwargs in records]
+
+
+def _records_valid(records: list[dict[str, Any]]) -> bool:
+    """Check a batch of register kwargs against the allowed enumerations.
+
+    Args:
+        records: Register init kwargs
+
+    Returns:
+        True if every record has the required fields, an address in range, and
+        valid enum values
+    """
+    if not all(kwargs.keys() >= _REQUIRED_FIELDS for kwargs in records):
+        return False
+    if not all(_valid_address(kwargs["address"]) for kwargs in records):
+        return False
+    try:
+        types = {kwargs.get("type", "holding") for kwargs in records}
+        datatypes = {kwargs.get("datatype", "uint16") for kwargs in records}
+        byte_orders = {kwargs.get("byte_order", "big") for kwargs in records}
+    except TypeError:  # unhashable value, e.g. a list
+        return False
+    return types <= REGISTER_TYPES and datatypes <= DATATYPES.keys() and byte_orders <= BYTE_ORDERS
+
+
+@dataclass(slots=True, frozen=True)
+class EventBlock:
+    """A single block read covering every register of an event, with its decode plan."""
+
+    register_type: str
+    start: int
+    count: int
+    field_names: tuple[str, ...]
+    decoder: BlockDecoder = field(repr=False, compare=False)
+
+    def decode(self, words: Sequence[int]) -> dict[str, float | int | bool]:
+        """Decode the block's words into {field_name: value}.
+
+        Args:
+            words: `count` register words read from `start`
+
+        Returns:
+            Decoded values keyed by register name
+        """
+        return dict(zip(self.field_names, self.decoder(words), strict=True))
+
+
+def _build_event_block(registers: Sequence[Register]) -> EventBlock | None:
+    """Plan a single block read and decode for an event, if its layout allows one.
+
+    Args:
+        registers: The event's registers, sorted by (type, address)
+
+    Returns:
+        EventBlock when all registers share one word register type, sit back to
+        back, and fit in one read request; None otherwise. Gaps are not read
+        through, since devices often reject reads of unmapped addresses.
+    """
+    if not registers:
+        return None
+    register_type = registers[0].type
+    if register_type in BIT_TYPES or any(r.type != register_type for r in registers):
+        return None
+
+    start = registers[0].address
+    end = start
+    for reg in registers:
+        if reg.address != end:
+            return None
+        end = reg.address + reg.count
+    if end - start > MAX_READ_REGISTERS:
+        return None
+
+    return EventBlock(
+        register_type=register_type,
+        start=start,
+        count=end - start,
+        field_names=tuple(r.name for r in registers),
+        decoder=_cached_block_decoder(
+            tuple((r.datatype, r.scale, r.byte_order) for r in registers), end - start
+        ),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class Event(Sequence[Register]):
+    """A named group of registers logged together as one Zelos trace event.
+
+    Behaves as a read-only sequence of its registers in JSON order, which is the
+    field order of the trace event, and carries the derived read plan with it.
+    Events are immutable so the derived fields can't drift from the registers;
+    an Event compares equal only to another Event, not to a list of registers.
+    """
+
+    name: str
+    registers: tuple[Register, ...] = ()
+
+    # Derived from `registers` on construction
+    sorted_registers: tuple[Register, ...] = field(init=False, repr=False, compare=False)
+    block: EventBlock | None = field(init=False, repr=False, compare=False)
+    _addresses: frozenset[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Freeze the registers and build the sorted view, block plan, and address set."""
+        # Frozen dataclass: fields are set through object.__setattr__
+        set_field = object.__setattr__
+        registers = tuple(self.registers)
+        set_field(self, "registers", registers)
+        # Read order; the registers themselves keep JSON order
+        sorted_registers = tuple(sorted(registers, key=lambda r: (r.type, r.address)))
+        set_field(self, "sorted_registers", sorted_registers)
+        set_field(self, "block", _build_event_block(sorted_registers))
+        set_field(
+            self,
+            "_addresses",
+            frozenset(_TYPE_CODES[r.type] << 16 | r.address for r in registers),
+        )
+
+    def __getstate__(self) -> tuple[str, tuple[Register, ...]]:
+        """Pickle only the name and registers; the block decoder can't be pickled."""
+        return (self.name, self.registers)
+
+    def __setstate__(self, state: tuple[str, tuple[Register, ...]]) -> None:
+        """Restore the name and registers and rebuild the derived fields."""
+        object.__setattr__(self, "name", state[0])
+        object.__setattr__(self, "registers", state[1])
+        self.__post_init__()
+
+    def __getitem__(self, index: int) -> Register:
+        return self.registers[index]
+
+    def __len__(self) -> int:
+        return len(self.registers)
+
+    def __iter__(self) -> Iterator[Register]:
+        return iter(self.registers)
+
+    def has_address(self, address: int, register_type: str = "holding") -> bool:
+        """Check whether the event has a register at an address.
+
+        Args:
+            address: Register address
+            register_type: Register type
+
+        Returns:
+            True if a register of this type starts at the address
+        """
+        code = _TYPE_CODES.get(register_type)
+        if code is None or not 0 <= address <= MAX_ADDRESS:
+            return False
+        return (code << 16 | address) in self._addresses
 
 
 @dataclass
 class RegisterMap:
     """Collection of register definitions organized by user-defined events."""
 
-    events: dict[str, list[Register]] = field(default_factory=dict)
+    events: dict[str, Event] = field(default_factory=dict)
     name: str = "modbus"
     description: str = ""
 
+    # Lookup indexes and flattened views, built once since the map is fixed after
+    # load (add_register rebuilds them). The returned lists are shared.
+    _by_type: dict[str, tuple[Register, ...]] = field(init=False, repr=False, compare=False)
+    _by_name: dict[str, Register] = field(init=False, repr=False, compare=False)
+    _by_addr_type: dict[int, Register] = field(init=False, repr=False, compare=False)
+    _sorted_by_type: dict[str, list[Register]] = field(init=False, repr=False, compare=False)
+    _addrs_by_type: dict[str, array.array] = field(init=False, repr=False, compare=False)
+    _spans_by_type: dict[str, array.array] = field(init=False, repr=False, compare=False)
+    _registers: list[Register] = field(init=False, repr=False, compare=False)
+    _event_names: list[str] = field(init=False, repr=False, compare=False)
+    _writable_registers: list[Register] = field(init=False, repr=False, compare=False)
+    _writable_names: list[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Wrap plain register lists into Events and build lookup indexes."""
+        # A new dict, so the caller's mapping is left untouched
+        self.events = {
+            event_name: regs if isinstance(regs, Event) else Event(event_name, tuple(regs))
+            for event_name, regs in self.events.items()
+        }
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """(Re)build every lookup index from the current events."""
+        registers = list(self.iter_registers())
+        self._registers = registers
+        self._event_names = list(self.events)
+        self._writable_registers = [r for r in registers if r.writable]
+        self._writable_names = [r.name for r in self._writable_registers]
+        self._by_type = {
+            reg_type: tuple(r for r in registers if r.type == reg_type)
+            for reg_type in REGISTER_TYPES
+        }
+        # Address-sorted registers with parallel address/span columns, for
+        # bisect range scans and read planning
+        self._sorted_by_type = {
+            reg_type: sorted(regs, key=lambda r: r.address)
+            for reg_type, regs in self._by_type.items()
+        }
+        self._addrs_by_type = {
+            reg_type: array.array("l", [r.address for r in regs])
+            for reg_type, regs in self._sorted_by_type.items()
+        }
+        self._spans_by_type = {
+            reg_type: array.array("l", [1 if r._is_bit else r.count for r in regs])
+            for reg_type, regs in self._sorted_by_type.items()
+        }
+        # setdefault keeps the first match, as the original linear scans did
+        self._by_name = {}
+        self._by_addr_type = {}
+        for reg in registers:
+            self._by_name.setdefault(reg.name, reg)
+            self._by_addr_type.setdefault(_TYPE_CODES[reg.type] << 16 | reg.address, reg)
+
     @classmethod
     def from_file(cls, path: str | Path) -> RegisterMap:
         """Load register map from JSON file.
 
+        Parsed maps are cached per file until its mtime or size changes. Each call
+        returns its own copy, so reloading an unchanged file skips parsing and
+        validation without sharing a mutable map between callers.
+
         Args:
             path: Path to JSON file
 
@@ -113,10 +493,75 @@ class RegisterMap:
         if not path.exists():
             raise FileNotFoundError(f"Register map file not found: {path}")
 
-        with path.open() as f:
-            data = json.load(f)
+        # Reuse the parsed map while the file is unchanged
+        st = path.stat()
+        cache_key = str(path.resolve())
+        cached = _MAP_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]._copy()
+
+        if ijson is not None and st.st_size > STREAM_THRESHOLD_BYTES:
+            register_map = cls._from_stream(path)
+        else:
+            register_map = cls.from_dict(_loads_json(path.read_bytes()))
+
+        _MAP_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, register_map)
+        return register_map._copy()
 
-        return cls.from_dict(data)
+    def _copy(self) -> RegisterMap:
+        """Copy the map, sharing the immutable Events but not the containers.
+
+        Returns:
+            RegisterMap with its own events dict and indexes
+        """
+        return type(self)(
+            events=self.events,
+            name=self.name,
+            description=self.description,
+        )
+
+    @classmethod
+    def _from_stream(cls, path: Path) -> RegisterMap:
+        """Load a large register map with ijson, one event at a time.
+
+        Only one event's raw register list is held in memory at once instead of
+        the whole JSON document.
+
+        Args:
+            path: Path to JSON file
+
+        Returns:
+            RegisterMap instance
+        """
+        events: dict[str, Event] = {}
+        text_cache: dict[str, str] = {}
+        top_level = {"name": "modbus", "description": ""}
+
+        # Single pass: top-level scalars are picked off the event stream, and each
+        # event's register list is assembled with an ObjectBuilder. Nesting depth,
+        # not the prefix, marks the end of a list, since event names may contain dots.
+        builder = None
+        event_name = ""
+        depth = 0
+        with path.open("rb") as f:
+            for prefix, kind, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(kind, value)
+                    if kind in ("start_map", "start_array"):
+                        depth += 1
+                    elif kind in ("end_map", "end_array"):
+                        depth -= 1
+                    if depth == 0:
+                        registers = _parse_registers(builder.value, text_cache)
+                        events[event_name] = Event(event_name, registers)
+                        builder = None
+                elif prefix == "events" and kind == "map_key":
+                    event_name = value
+                    builder = ijson.ObjectBuilder()
+                elif prefix in top_level and kind == "string":
+                    top_level[prefix] = value
+
+        return cls(events=events, name=top_level["name"], description=top_level["description"])
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> RegisterMap:
@@ -128,24 +573,12 @@ class RegisterMap:
         Returns:
             RegisterMap instance
         """
-        events: dict[str, list[Register]] = {}
+        events: dict[str, Event] = {}
+        # Free-text fields repeat across registers; share one string per value
+        text_cache: dict[str, str] = {}
 
         for event_name, registers_data in data.get("events", {}).items():
-            registers = []
-            for reg_data in registers_data:
-                reg = Register(
-                    address=reg_data["address"],
-                    name=reg_data["name"],
-                    type=reg_data.get("type", "holding"),
-                    datatype=reg_data.get("datatype", "uint16"),
-                    unit=reg_data.get("unit", ""),
-                    scale=reg_data.get("scale", 1.0),
-                    byte_order=reg_data.get("byte_order", "big"),
-                    description=reg_data.get("description", ""),
-                    writable=reg_data.get("writable", True),
-                )
-                registers.append(reg)
-            events[event_name] = registers
+            events[event_name] = Event(event_name, _parse_registers(registers_data, text_cache))
 
         return cls(
             events=events,
@@ -153,29 +586,163 @@ class RegisterMap:
             description=data.get("description", ""),
         )
 
+    def add_register(self, event_name: str, register: Register) -> None:
+        """Append a register to an event, creating the event if needed.
+
+        Mutating `events` directly leaves the lookup indexes stale; use this instead.
+
+        Args:
+            event_name: Event to add the register to
+            register: Register definition
+        """
+        event = self.events.get(event_name)
+        registers = (*event.registers, register) if event is not None else (register,)
+        self.events[event_name] = Event(event_name, registers)
+        self._build_indexes()
+
+    def iter_registers(self) -> Iterator[Register]:
+        """Iterate all registers across all events without building a list.
+
+        Returns:
+            Iterator over registers in event order
+        """
+        return itertools.chain.from_iterable(self.events.values())
+
+    def iter_event_registers(self) -> Iterator[tuple[Event, Register]]:
+        """Iterate all registers together with the event they belong to.
+
+        Returns:
+            Iterator over (event, register) pairs in event order
+        """
+        return ((event, reg) for event in self.events.values() for reg in event.registers)
+
     @property
     def registers(self) -> list[Register]:
         """Flat list of all registers across all events."""
-        all_regs = []
-        for regs in self.events.values():
-            all_regs.extend(regs)
-        return all_regs
+        return self._registers
 
     @property
     def event_names(self) -> list[str]:
         """List of all event names."""
-        return list(self.events.keys())
+        return self._event_names
 
-    def get_event(self, event_name: str) -> list[Register]:
+    def get_event(self, event_name: str) -> Sequence[Register]:
         """Get all registers for an event.
 
         Args:
             event_name: Name of the event
 
         Returns:
-            List of registers for this event
+            The Event, a read-only sequence of its registers; an empty tuple if
+            the event does not exist. Compare contents with list(...), since an
+            Event is not equal to a list.
         """
-        return self.events.get(event_name, [])
+        return self.events.get(event_name, _EMPTY)
+
+    def get_event_sorted(self, event_name: str) -> tuple[Register, ...]:
+        """Get an event's registers sorted by (type, address).
+
+        Args:
+            event_name: Name of the event
+
+        Returns:
+            Registers in read order; empty if the event does not exist
+        """
+        event = self.events.get(event_name)
+        return event.sorted_registers if event is not None else _EMPTY
+
+    def get_event_block(self, event_name: str) -> EventBlock | None:
+        """Get the precomputed block read and decoder for an event.
+
+        Args:
+            event_name: Name of the event
+
+        Returns:
+            EventBlock if the event fits in one block read, None otherwise
+        """
+        event = self.events.get(event_name)
+        return event.block if event is not None else None
+
+    def get_by_type(self, register_type: str) -> tuple[Register, ...]:
+        """Get all registers of a Modbus register type.
+
+        Args:
+            register_type: Register type (holding/input/coil/discrete_input)
+
+        Returns:
+            Registers of this type, in map order
+        """
+        return self._by_type.get(register_type, _EMPTY)
+
+    def get_range(self, register_type: str, start: int, end: int) -> list[Register]:
+        """Get registers of a type whose start address falls in [start, end).
+
+        Args:
+            register_type: Register type (holding/input/coil/discrete_input)
+            start: First address (inclusive)
+            end: Last address (exclusive)
+
+        Returns:
+            Matching registers sorted by address
+        """
+        addrs = self._addrs_by_type.get(register_type)
+        if not addrs:
+            return []
+        lo = bisect.bisect_left(addrs, start)
+        hi = bisect.bisect_left(addrs, end, lo)
+        return self._sorted_by_type[register_type][lo:hi]
+
+    def plan_reads(
+        self,
+        register_type: str,
+        max_gap: int = 0,
+        max_count: int | None = None,
+        registers: Iterable[Register] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Coalesce the registers of a type into block read requests.
+
+        Registers are merged into one request while the hole between them is at
+        most `max_gap` addresses and the request stays within `max_count`.
+
+        Args:
+            register_type: Register type (holding/input/coil/discrete_input)
+            max_gap: Largest run of unmapped addresses to read through
+            max_count: Largest request size; defaults to the Modbus PDU limit
+                for the type (2000 bits or 125 registers)
+            registers: Plan only these registers; registers of other types are
+                ignored. Defaults to every register of the type in the map.
+
+        Returns:
+            (start address, count) pairs sorted by address
+        """
+        if registers is None:
+            addrs = self._addrs_by_type.get(register_type)
+            spans = self._spans_by_type.get(register_type)
+        else:
+            subset = sorted(
+                (r for r in registers if r.type == register_type), key=lambda r: r.address
+            )
+            addrs = [r.address for r in subset]
+            spans = [1 if r._is_bit else r.count for r in subset]
+        if not addrs:
+            return []
+        if max_count is None:
+            max_count = MAX_READ_BITS if register_type in BIT_TYPES else MAX_READ_REGISTERS
+
+        blocks: list[tuple[int, int]] = []
+        start = addrs[0]
+        end = start + spans[0]
+        # The first register opens the first block; a register wider than
+        # max_count still gets exactly one request of its own
+        for addr, span in zip(addrs[1:], spans[1:], strict=True):
+            reg_end = addr + span
+            if addr - end <= max_gap and max(end, reg_end) - start <= max_count:
+                end = max(end, reg_end)
+                continue
+            blocks.append((start, end - start))
+            start, end = addr, reg_end
+        blocks.append((start, end - start))
+        return blocks
 
     def get_by_name(self, name: str) -> Register | None:
         """Find register by name across all events.
@@ -186,11 +753,7 @@ class RegisterMap:
         Returns:
             Register if found, None otherwise
         """
-        for regs in self.events.values():
-            for reg in regs:
-                if reg.name == name:
-                    return reg
-        return None
+        return self._by_name.get(name)
 
     def get_by_address(self, address: int, register_type: str = "holding") -> Register | None:
         """Find register by address and type.
@@ -202,18 +765,17 @@ class RegisterMap:
         Returns:
             Register if found, None otherwise
         """
-        for regs in self.events.values():
-            for reg in regs:
-                if reg.address == address and reg.type == register_type:
-                    return reg
-        return None
+        code = _TYPE_CODES.get(register_type)
+        if code is None or not 0 <= address <= MAX_ADDRESS:
+            return None
+        return self._by_addr_type.get(code << 16 | address)
 
     @property
     def writable_registers(self) -> list[Register]:
         """Flat list of all writable registers."""
-        return [r for r in self.registers if r.writable]
+        return self._writable_registers
 
     @property
     def writable_names(self) -> list[str]:
         """List of all writable register names."""
-        return [r.name for r in self.writable_registers]
+        return self._writable_names